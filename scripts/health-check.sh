@@ -34,13 +34,29 @@ check_service() {
     fi
 }
 
+# Listening TCP ports, collected once with ss (reads /proc, no per-port probe).
+# Ports ss does not list (e.g. published by docker without userland-proxy)
+# are still probed with nc, so an empty or partial list only costs a connect.
+LISTENING_PORTS=""
+if command -v ss &> /dev/null; then
+    LISTENING_PORTS=$(ss -tlnH | awk '{n = split($4, a, ":"); print a[n]}' | sort -u)
+fi
+
+port_listening() {
+    local port=$1
+    if [ -n "$LISTENING_PORTS" ] && grep -qx "$port" <<< "$LISTENING_PORTS"; then
+        return 0
+    fi
+    nc -z localhost "$port" 2>/dev/null
+}
+
 check_port() {
     local name=$1
     local port=$2
     
     printf "%-30s" "$name"
     
-    if nc -z localhost "$port" 2>/dev/null; then
+    if port_listening "$port"; then
         echo -e "${GREEN}✓ Listening on :$port${NC}"
         return 0
     else
@@ -4,7 +4,7 @@ ZMQ handler decorators
 from typing import Callable, Union
 
 
-def zmq_handler(name: Union[str, None]) -> Callable:
+def zmq_handler(name: Union[str, None], *, concurrent: bool = False) -> Callable:
     """Decorator to mark a method as an RPC handler.
 
     Usage:
@@ -16,6 +16,10 @@ def zmq_handler(name: Union[str, None]) -> Callable:
     discover and register only explicitly-marked handlers. It does NOT
     alter the method behavior; handlers should return their own
     "not implemented" response if appropriate (keeps behavior explicit).
+
+    RPC calls run concurrently, so the registrar runs handlers one at a time
+    unless they pass concurrent=True. Only read-only handlers should do so;
+    anything that changes plugin or session state must stay serialized.
     """
 
     if not name or not isinstance(name, str):
@@ -24,6 +28,7 @@ def zmq_handler(name: Union[str, None]) -> Callable:
     def decorator(fn: Callable) -> Callable:
         setattr(fn, "_zmq_handler_name", name)
         setattr(fn, "_zmq_handler_marked", True)
+        setattr(fn, "_zmq_handler_concurrent", concurrent)
         return fn
 
     return decorator
@@ -24,7 +24,7 @@ class JackHandlers:
         pass
 
     # JACK audio system handlers
-    @zmq_handler("get_jack_status")
+    @zmq_handler("get_jack_status", concurrent=True)
     async def handle_get_jack_status(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK server status"""
         try:
@@ -35,7 +35,7 @@ class JackHandlers:
             logger.error("Failed to get JACK status: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_connections")
+    @zmq_handler("get_jack_connections", concurrent=True)
     async def handle_get_jack_connections(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK port connections"""
         try:
@@ -80,7 +80,7 @@ class JackHandlers:
             logger.error("Failed to disconnect JACK ports: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_ports")
+    @zmq_handler("get_jack_ports", concurrent=True)
     async def handle_get_jack_ports(self, **_kwargs) -> Dict[str, Any]:
         """Get all JACK ports"""
         try:
@@ -91,7 +91,7 @@ class JackHandlers:
             logger.error("Failed to get JACK ports: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_audio_ports")
+    @zmq_handler("get_jack_audio_ports", concurrent=True)
     async def handle_get_jack_audio_ports(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK audio ports"""
         try:
@@ -102,7 +102,7 @@ class JackHandlers:
             logger.error("Failed to get JACK audio ports: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_midi_ports")
+    @zmq_handler("get_jack_midi_ports", concurrent=True)
     async def handle_get_jack_midi_ports(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK MIDI ports"""
         try:
@@ -113,7 +113,7 @@ class JackHandlers:
             logger.error("Failed to get JACK MIDI ports: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_cv_ports")
+    @zmq_handler("get_jack_cv_ports", concurrent=True)
     async def handle_get_jack_cv_ports(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK CV ports"""
         try:
@@ -139,7 +139,7 @@ class JackHandlers:
             logger.error("Failed to set JACK transport: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_transport")
+    @zmq_handler("get_jack_transport", concurrent=True)
     async def handle_get_jack_transport(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK transport state"""
         try:
@@ -150,7 +150,7 @@ class JackHandlers:
             logger.error("Failed to get JACK transport: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_samplerate")
+    @zmq_handler("get_jack_samplerate", concurrent=True)
     async def handle_get_jack_samplerate(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK sample rate"""
         try:
@@ -161,7 +161,7 @@ class JackHandlers:
             logger.error("Failed to get JACK samplerate: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_buffersize")
+    @zmq_handler("get_jack_buffersize", concurrent=True)
     async def handle_get_jack_buffersize(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK buffer size"""
         try:
@@ -187,7 +187,7 @@ class JackHandlers:
             logger.error("Failed to set JACK buffersize: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_latency")
+    @zmq_handler("get_jack_latency", concurrent=True)
     async def handle_get_jack_latency(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK latency"""
         try:
@@ -198,7 +198,7 @@ class JackHandlers:
             logger.error("Failed to get JACK latency: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_xruns")
+    @zmq_handler("get_jack_xruns", concurrent=True)
     async def handle_get_jack_xruns(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK xruns count"""
         try:
@@ -220,7 +220,7 @@ class JackHandlers:
             logger.error("Failed to reset JACK xruns: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_dsp_load")
+    @zmq_handler("get_jack_dsp_load", concurrent=True)
     async def handle_get_jack_dsp_load(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK DSP load"""
         try:
@@ -231,7 +231,7 @@ class JackHandlers:
             logger.error("Failed to get JACK DSP load: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_freewheel")
+    @zmq_handler("get_jack_freewheel", concurrent=True)
     async def handle_get_jack_freewheel(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK freewheel state"""
         try:
@@ -257,7 +257,7 @@ class JackHandlers:
             logger.error("Failed to set JACK freewheel: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_timebase")
+    @zmq_handler("get_jack_timebase", concurrent=True)
     async def handle_get_jack_timebase(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK timebase state"""
         try:
@@ -283,7 +283,7 @@ class JackHandlers:
             logger.error("Failed to set JACK timebase: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_repl_sync")
+    @zmq_handler("get_jack_repl_sync", concurrent=True)
     async def handle_get_jack_repl_sync(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK repl sync state"""
         try:
@@ -309,7 +309,7 @@ class JackHandlers:
             logger.error("Failed to set JACK repl sync: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_jack_repl_latency")
+    @zmq_handler("get_jack_repl_latency", concurrent=True)
     async def handle_get_jack_repl_latency(self, **_kwargs) -> Dict[str, Any]:
         """Get JACK repl latency"""
         try:
@@ -92,7 +92,7 @@ class PedalboardHandlers:
             logger.error("Failed to get current pedalboard: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_pedalboard_list")
+    @zmq_handler("get_pedalboard_list", concurrent=True)
     async def handle_get_pedalboard_list(self, **_kwargs) -> Dict[str, Any]:
         """Get list of available pedalboards"""
         try:
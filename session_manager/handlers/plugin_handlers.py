@@ -24,7 +24,7 @@ class PluginHandlers:
         pass
 
     # Plugin management handlers
-    @zmq_handler("get_available_plugins")
+    @zmq_handler("get_available_plugins", concurrent=True)
     async def handle_get_available_plugins(self, **_kwargs) -> Dict[str, Any]:
         """Get available plugins"""
         try:
@@ -62,7 +62,7 @@ class PluginHandlers:
             logger.error("Failed to unload plugin: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_plugin_info")
+    @zmq_handler("get_plugin_info", concurrent=True)
     async def handle_get_plugin_info(self, **kwargs) -> Dict[str, Any]:
         """Get plugin info"""
         try:
@@ -76,7 +76,7 @@ class PluginHandlers:
             logger.error("Failed to get plugin info: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_plugins_bulk")
+    @zmq_handler("get_plugins_bulk", concurrent=True)
     async def handle_get_plugins_bulk(self, **kwargs) -> Dict[str, Any]:
         """Get bulk plugin information for multiple URIs"""
         try:
@@ -101,7 +101,7 @@ class PluginHandlers:
             logger.error("Failed to get bulk plugin info: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("list_plugins")
+    @zmq_handler("list_plugins", concurrent=True)
     async def handle_list_plugins(self, **_kwargs) -> Dict[str, Any]:
         """List all available plugins (not instances)"""
         try:
@@ -111,7 +111,7 @@ class PluginHandlers:
             logger.error("Failed to list plugins: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_plugin_info_by_uri")
+    @zmq_handler("get_plugin_info_by_uri", concurrent=True)
     async def handle_get_plugin_info_by_uri(self, **kwargs) -> Dict[str, Any]:
         """Get plugin information by URI"""
         try:
@@ -160,7 +160,7 @@ class PluginHandlers:
             logger.error("Failed to remove plugin: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("list_instances")
+    @zmq_handler("list_instances", concurrent=True)
     async def handle_list_instances(self, **_kwargs) -> Dict[str, Any]:
         """List plugin instances"""
         try:
@@ -187,7 +187,7 @@ class PluginHandlers:
             logger.error("Failed to set parameter: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_parameter")
+    @zmq_handler("get_parameter", concurrent=True)
     async def handle_get_parameter(self, **kwargs) -> Dict[str, Any]:
         """Get plugin parameter"""
         try:
@@ -1,6 +1,7 @@
 """
 System control and snapshot ZMQ handlers
 """
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict
@@ -26,29 +27,38 @@ class SystemHandlers:
         pass
 
     # System control handlers
-    @zmq_handler("get_system_status")
+    @zmq_handler("get_system_status", concurrent=True)
     async def handle_get_system_status(self, **_kwargs) -> Dict[str, Any]:
         """Get system status"""
         try:
             import psutil
             import os
             
+            # The uptime command and the 1 s CPU sample block, so run them in
+            # worker threads concurrently instead of stalling the event loop
+            uptime, cpu_percent = await asyncio.gather(
+                asyncio.to_thread(lambda: os.popen("uptime").read().strip()),
+                asyncio.to_thread(psutil.cpu_percent, interval=1),
+            )
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
+
             # Get basic system information
             status = {
-                "uptime": os.popen("uptime").read().strip(),
+                "uptime": uptime,
                 "load_avg": os.getloadavg(),
                 "memory": {
-                    "total": psutil.virtual_memory().total,
-                    "available": psutil.virtual_memory().available,
-                    "percent": psutil.virtual_memory().percent
+                    "total": memory.total,
+                    "available": memory.available,
+                    "percent": memory.percent
                 },
                 "disk": {
-                    "total": psutil.disk_usage('/').total,
-                    "used": psutil.disk_usage('/').used,
-                    "free": psutil.disk_usage('/').free,
-                    "percent": psutil.disk_usage('/').percent
+                    "total": disk.total,
+                    "used": disk.used,
+                    "free": disk.free,
+                    "percent": disk.percent
                 },
-                "cpu_percent": psutil.cpu_percent(interval=1),
+                "cpu_percent": cpu_percent,
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -108,7 +118,7 @@ class SystemHandlers:
             logger.error("Failed to reboot: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_system_info")
+    @zmq_handler("get_system_info", concurrent=True)
     async def handle_get_system_info(self, **_kwargs) -> Dict[str, Any]:
         """Get system information"""
         try:
@@ -164,7 +174,7 @@ class SystemHandlers:
             logger.error("Failed to get system info: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_cpu_usage")
+    @zmq_handler("get_cpu_usage", concurrent=True)
     async def handle_get_cpu_usage(self, **_kwargs) -> Dict[str, Any]:
         """Get CPU usage"""
         try:
@@ -192,7 +202,7 @@ class SystemHandlers:
             logger.error("Failed to get CPU usage: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_memory_usage")
+    @zmq_handler("get_memory_usage", concurrent=True)
     async def handle_get_memory_usage(self, **_kwargs) -> Dict[str, Any]:
         """Get memory usage"""
         try:
@@ -237,7 +247,7 @@ class SystemHandlers:
             logger.error("Failed to get memory usage: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_disk_usage")
+    @zmq_handler("get_disk_usage", concurrent=True)
     async def handle_get_disk_usage(self, **_kwargs) -> Dict[str, Any]:
         """Get disk usage"""
         try:
@@ -283,7 +293,7 @@ class SystemHandlers:
             logger.error("Failed to get disk usage: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_network_info")
+    @zmq_handler("get_network_info", concurrent=True)
     async def handle_get_network_info(self, **_kwargs) -> Dict[str, Any]:
         """Get network information"""
         try:
@@ -337,7 +347,7 @@ class SystemHandlers:
             logger.error("Failed to get network info: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_logs")
+    @zmq_handler("get_logs", concurrent=True)
     async def handle_get_logs(self, **kwargs) -> Dict[str, Any]:
         """Get system logs"""
         try:
@@ -467,7 +477,7 @@ class SystemHandlers:
             logger.error("Failed to clear logs: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_config")
+    @zmq_handler("get_config", concurrent=True)
     async def handle_get_config(self, **kwargs) -> Dict[str, Any]:
         """Get system configuration"""
         try:
@@ -685,7 +695,7 @@ class SystemHandlers:
             logger.error("Failed to remove snapshot: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("list_snapshots")
+    @zmq_handler("list_snapshots", concurrent=True)
     async def handle_list_snapshots(self, **_kwargs) -> Dict[str, Any]:
         """Get all snapshots for current pedalboard"""
         try:
@@ -695,7 +705,7 @@ class SystemHandlers:
             logger.error("Failed to list snapshots: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_snapshot_name")
+    @zmq_handler("get_snapshot_name", concurrent=True)
     async def handle_get_snapshot_name(self, **kwargs) -> Dict[str, Any]:
         """Get the name of a specific snapshot"""
         try:
@@ -730,7 +740,7 @@ class SystemHandlers:
 
 
     # Bank and preset handlers
-    @zmq_handler("get_banks")
+    @zmq_handler("get_banks", concurrent=True)
     async def handle_get_banks(self, **_kwargs) -> Dict[str, Any]:
         """Get banks"""
         try:
@@ -800,7 +810,7 @@ class SystemHandlers:
             return {"success": False, "error": str(e)}
 
     # File operation handlers
-    @zmq_handler("list_files")
+    @zmq_handler("list_files", concurrent=True)
     async def handle_list_files(self, **kwargs) -> Dict[str, Any]:
         """List files"""
         try:
@@ -1049,7 +1059,7 @@ class SystemHandlers:
             logger.error("Failed to install update: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_packages")
+    @zmq_handler("get_packages", concurrent=True)
     async def handle_get_packages(self, **_kwargs) -> Dict[str, Any]:
         """Get packages"""
         try:
@@ -1213,7 +1223,7 @@ class SystemHandlers:
             logger.error("Failed to logout: %s", e)
             return {"success": False, "error": str(e)}
 
-    @zmq_handler("get_user_info")
+    @zmq_handler("get_user_info", concurrent=True)
     async def handle_get_user_info(self, **kwargs) -> Dict[str, Any]:
         """Get user information"""
         try:
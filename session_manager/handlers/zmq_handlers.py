@@ -4,6 +4,8 @@ Main ZMQ handlers module - imports and registers all handler modules
 This file maintains backward compatibility while delegating to the new modular structure.
 """
 
+import asyncio
+import functools
 import logging
 from typing import Any, Dict
 
@@ -33,6 +35,9 @@ class ZMQHandlers:
         self.session_manager = session_manager
         self.zmq_service = zmq_service
         self.config_manager = config_manager
+        # Held by every handler not marked concurrent=True, so calls that
+        # change plugin or session state never interleave
+        self._exclusive = asyncio.Lock()
 
         # Initialize handler modules
         self.plugin_handlers = PluginHandlers(
@@ -90,9 +95,22 @@ class ZMQHandlers:
             attr = getattr(obj, attr_name)
             if callable(attr) and hasattr(attr, '_zmq_handler_marked'):
                 method_name = getattr(attr, '_zmq_handler_name')
+                if not getattr(attr, '_zmq_handler_concurrent', False):
+                    attr = self._serialized(attr)
                 self.zmq_service.register_handler(method_name, attr)
                 logger.debug("Registered handler: %s -> %s.%s", method_name, obj.__class__.__name__, attr_name)
 
+    def _serialized(self, handler):
+        """Wrap a handler so it runs while holding the exclusive lock"""
+        @functools.wraps(handler)
+        async def run_exclusive(**kwargs):
+            async with self._exclusive:
+                if asyncio.iscoroutinefunction(handler):
+                    return await handler(**kwargs)
+                return handler(**kwargs)
+
+        return run_exclusive
+
     # Legacy methods for backward compatibility (if needed)
     # These delegate to the appropriate handler modules
 
@@ -112,7 +130,7 @@ class ZMQHandlers:
         """Legacy method - delegates to PedalboardHandlers"""
         return await self.pedalboard_handlers.handle_reset_pedalboard(**kwargs)
 
-    @zmq_handler("health_check")
+    @zmq_handler("health_check", concurrent=True)
     async def handle_health_check(self, **kwargs) -> Dict[str, Any]:
         """
         Health check endpoint to verify service chain status
@@ -142,7 +160,7 @@ class ZMQHandlers:
             "mod_host_connected": mod_host_connected,
         }
 
-    @zmq_handler("get_metrics")
+    @zmq_handler("get_metrics", concurrent=True)
     async def handle_get_metrics(self, **kwargs) -> Dict[str, Any]:
         """
         Get service metrics for monitoring
@@ -155,12 +173,14 @@ class ZMQHandlers:
         try:
             process = psutil.Process()
             create_time = datetime.fromtimestamp(process.create_time())
+            # Sample CPU off the event loop; the 0.1 s interval would block it
+            cpu_percent = await asyncio.to_thread(process.cpu_percent, interval=0.1)
             
             metrics = {
                 "success": True,
                 "uptime_seconds": (datetime.now() - create_time).total_seconds(),
                 "memory_mb": round(process.memory_info().rss / 1024 / 1024, 2),
-                "cpu_percent": round(process.cpu_percent(interval=0.1), 2),
+                "cpu_percent": round(cpu_percent, 2),
                 "num_threads": process.num_threads(),
                 "bridge_connected": self.bridge_client._connected if self.bridge_client else False,
                 "active_plugins": len(self.plugin_manager.plugins) if hasattr(self.plugin_manager, 'plugins') else 0,
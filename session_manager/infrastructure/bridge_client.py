@@ -15,6 +15,8 @@ from typing import Any, Dict, Optional
 import zmq
 import zmq.asyncio
 
+from .json_codec import dumps as _dumps, loads as _loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,12 +30,16 @@ class BridgeClient:
         self._connected = False
         self._running = False
         self._reconnect_task: Optional[asyncio.Task] = None
+        # REQ sockets require strict send/recv alternation, so concurrent
+        # callers (e.g. asyncio.gather) take turns on the socket.
+        self._request_lock = asyncio.Lock()
         self.service_name = "bridge_client"
 
     async def start(self):
         """Connect to the modhost-bridge"""
         try:
-            self.context = zmq.asyncio.Context()
+            # Process-wide context, shared with ZMQService; never terminated here
+            self.context = zmq.asyncio.Context.instance()
             self.socket = self.context.socket(zmq.REQ)
             self.socket.connect(self.endpoint)
             self._connected = True
@@ -62,9 +68,7 @@ class BridgeClient:
                 pass
                 
         if self.socket:
-            self.socket.close()
-        if self.context:
-            self.context.term()
+            self.socket.close(linger=0)
         logger.info("Disconnected from modhost-bridge")
 
     async def call(self, service_name: str, method: str, timeout: Optional[float] = None, **kwargs) -> Dict[str, Any]:
@@ -95,6 +99,7 @@ class BridgeClient:
             "get_parameter",
             "get_available_plugins",
             "get_plugin_essentials",
+            "clear_all",
         }:
             action = "plugin"
         elif method == "create_connection":
@@ -140,16 +145,18 @@ class BridgeClient:
             return {"success": False, "error": "Not connected to modhost-bridge"}
 
         try:
-            # Send JSON request
-            request_json = json.dumps(request)
-            await self.socket.send_string(request_json)
-
-            # Wait for response with timeout
+            # Send JSON request (encoded straight to bytes)
+            request_json = _dumps(request)
             timeout_seconds = float(os.getenv("MODHOST_BRIDGE_TIMEOUT", "5.0"))
-            response_json = await asyncio.wait_for(self.socket.recv_string(), timeout=timeout_seconds)
 
-            # Parse and return response
-            return json.loads(response_json)
+            async with self._request_lock:
+                await self.socket.send(request_json)
+
+                # Wait for response with timeout
+                response_json = await asyncio.wait_for(self.socket.recv(), timeout=timeout_seconds)
+
+            # Parse and return response (orjson.JSONDecodeError subclasses json's)
+            return _loads(response_json)
 
         except asyncio.TimeoutError:
             logger.error("Timeout waiting for modhost-bridge response")
@@ -0,0 +1,36 @@
+"""JSON encoding for ZeroMQ messages, using orjson when it is installed.
+
+Both encoders produce the same wire format: non-str dict keys are
+stringified, as json.dumps does, and read-only mapping views (such as the
+parameter views in snapshots) are encoded as objects.
+"""
+import json
+from types import MappingProxyType
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    # Optional: stdlib json is used when orjson is not installed
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_default).encode("utf-8")
+
+
+if orjson is not None:
+    def _orjson_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    dumps = _orjson_dumps
+    loads = orjson.loads
+else:
+    dumps = _json_dumps
+    loads = json.loads
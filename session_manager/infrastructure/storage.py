@@ -4,6 +4,7 @@ This module stores pedalboards as JSON files under a data directory. It uses
 atomic writes (temp file + rename) and provides list/load/delete helpers.
 """
 
+import functools
 import json
 import os
 import uuid
@@ -16,6 +17,17 @@ DEFAULT_DATA_DIR = os.getenv(
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _data_dir() -> str:
+    """Resolve the storage root once (SESSION_MANAGER_DATA_DIR or the default)."""
+    return os.getenv("SESSION_MANAGER_DATA_DIR", DEFAULT_DATA_DIR)
+
+
+def _reset_data_dir_cache() -> None:
+    """Forget the resolved storage root (e.g. after changing the env)."""
+    _data_dir.cache_clear()
+
+
 def _ensure_dir(dirpath: str) -> Path:
     p = Path(dirpath)
     p.mkdir(parents=True, exist_ok=True)
@@ -27,7 +39,7 @@ def save_pedalboard(
     pedalboard: Dict, pb_id: Optional[str] = None, data_dir: Optional[str] = None
 ) -> Tuple[str, str]:
     """Save a pedalboard dict to disk. Returns (id, path)."""
-    dirpath = data_dir or DEFAULT_DATA_DIR
+    dirpath = data_dir or _data_dir()
     base = _ensure_dir(dirpath) / "pedalboards"
 
     if pb_id is None:
@@ -38,8 +50,8 @@ def save_pedalboard(
 
     # Add saved metadata and schema version
     payload = dict(pedalboard)
-    payload.setdefault("metadata", {})
-    payload["metadata"]["saved_at"] = datetime.now().isoformat()
+    # Copy metadata rather than mutating the caller's (possibly cached) dict
+    payload["metadata"] = {**payload.get("metadata", {}), "saved_at": datetime.now().isoformat()}
     # Add schema version to allow future migrations
     payload.setdefault("_schema_version", 1)
 
@@ -53,7 +65,7 @@ def save_pedalboard(
 
 
 def list_pedalboards(data_dir: Optional[str] = None) -> List[Dict]:
-    dirpath = data_dir or DEFAULT_DATA_DIR
+    dirpath = data_dir or _data_dir()
     base = Path(dirpath) / "pedalboards"
     if not base.exists():
         return []
@@ -79,7 +91,7 @@ def list_pedalboards(data_dir: Optional[str] = None) -> List[Dict]:
 
 
 def load_pedalboard(pb_id: str, data_dir: Optional[str] = None) -> Optional[Dict]:
-    dirpath = data_dir or DEFAULT_DATA_DIR
+    dirpath = data_dir or _data_dir()
     path = Path(dirpath) / "pedalboards" / f"{pb_id}.json"
     if not path.exists():
         return None
@@ -118,7 +130,7 @@ def import_pedalboard(
 
     # Generate id
     pb_id = uuid.uuid4().hex
-    dirpath = data_dir or DEFAULT_DATA_DIR
+    dirpath = data_dir or _data_dir()
     base = _ensure_dir(dirpath) / "pedalboards"
     path = base / f"{pb_id}.json"
     tmp = base / f".{pb_id}.json.tmp"
@@ -130,7 +142,7 @@ def import_pedalboard(
 
 
 def delete_pedalboard(pb_id: str, data_dir: Optional[str] = None) -> bool:
-    dirpath = data_dir or DEFAULT_DATA_DIR
+    dirpath = data_dir or _data_dir()
     path = Path(dirpath) / "pedalboards" / f"{pb_id}.json"
     if path.exists():
         path.unlink()
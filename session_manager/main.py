@@ -52,6 +52,10 @@ class SessionManagerService:
         self.zmq_service = None
         self.bridge_client = None
         self.running = False
+        # Signalled once startup() completes, and once the optional default
+        # pedalboard has been created; lets callers wait instead of sleeping.
+        self.ready_event = asyncio.Event()
+        self.default_pedalboard_created = asyncio.Event()
 
     async def startup(self):
         """Start and initialize all managed components.
@@ -74,7 +78,8 @@ class SessionManagerService:
 
             # Initialize ZeroMQ service
             self.zmq_service = ZMQService(SERVICE_NAME)
-            await self.zmq_service.start()
+            if not await self.zmq_service.start():
+                raise RuntimeError("ZeroMQ service failed to start")
             logger.info("ZeroMQ service started")
 
             # Initialize bridge client for communication with modhost-bridge service
@@ -125,7 +130,7 @@ class SessionManagerService:
             auto_create = os.environ.get("SESSION_MANAGER_AUTO_CREATE_DEFAULT", "0")
             if str(auto_create) in ("1", "true", "True", "yes", "on"):
                 logger.info("Auto-create default pedalboard requested; creating...")
-                asyncio.create_task(self.session_manager.create_pedalboard("Default"))
+                asyncio.create_task(self._create_default_pedalboard())
 
             # Register ZeroMQ methods
             handlers = ZMQHandlers(
@@ -139,6 +144,7 @@ class SessionManagerService:
 
             # Mark the service as running and log successful startup.
             self.running = True
+            self.ready_event.set()
             logger.info("%s service started successfully", SERVICE_NAME)
 
         except Exception as e:
@@ -146,6 +152,14 @@ class SessionManagerService:
             await self.shutdown()
             raise
 
+    async def _create_default_pedalboard(self):
+        """Create the startup "Default" pedalboard and signal completion."""
+        try:
+            await self.session_manager.create_pedalboard("Default")
+            self.default_pedalboard_created.set()
+        except Exception as e:
+            logger.error("Failed to auto-create default pedalboard: %s", e)
+
     async def shutdown(self):
         """Shut down components and release resources.
 
@@ -154,9 +168,12 @@ class SessionManagerService:
         """
         logger.info("Shutting down %s service", SERVICE_NAME)
         self.running = False
+        self.ready_event.clear()
+        self.default_pedalboard_created.clear()
 
         if self.session_manager:
             logger.info("Shutting down session manager")
+            await self.session_manager.close()
 
         if self.plugin_manager:
             await self.plugin_manager.shutdown()
@@ -208,7 +225,16 @@ class SessionManagerService:
             await self.shutdown()
 
 
-logging.basicConfig(level=logging.INFO)
+def _configure_logging() -> None:
+    """Configure the root logger from LOG_LEVEL, falling back to INFO if it is invalid."""
+    name = os.getenv("LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelNamesMapping().get(name)
+    logging.basicConfig(level=level if level is not None else logging.INFO)
+    if level is None:
+        logger.warning("Unknown LOG_LEVEL %r, using INFO", name)
+
+
+_configure_logging()
 
 if __name__ == "__main__":
     service = SessionManagerService()
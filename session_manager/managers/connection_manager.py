@@ -1,17 +1,21 @@
 """Simple manager for connections to decouple list handling from SessionManager."""
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ..models.connection import Connection
 
 
 class ConnectionManager:
-    """Keep and manage Connection objects."""
+    """Keep and manage Connection objects.
+
+    Connections are stored in a dict keyed by connection_id (insertion
+    ordered), so lookups and removals do not scan the whole collection.
+    """
 
     def __init__(self, initial: Optional[List[Connection]] = None):
-        self._connections: List[Connection] = list(initial or [])
+        self._connections: Dict[str, Connection] = {c.connection_id: c for c in initial or []}
 
     def add(self, connection: Connection) -> None:
-        self._connections.append(connection)
+        self._connections[connection.connection_id] = connection
 
     # list-like alias
     def append(self, connection: Connection) -> None:
@@ -22,28 +26,30 @@ class ConnectionManager:
 
         If passed a Connection object, it will be removed. Returns True if removed.
         """
-        # accept either Connection or connection_id
-        target_id = None
-        if hasattr(connection_or_id, "connection_id"):
-            target_id = connection_or_id.connection_id
-        else:
-            target_id = connection_or_id
+        return self.pop(getattr(connection_or_id, "connection_id", connection_or_id)) is not None
 
-        before = len(self._connections)
-        self._connections = [c for c in self._connections if c.connection_id != target_id]
-        return len(self._connections) < before
+    def pop(self, connection_id: str) -> Optional[Connection]:
+        """Remove and return the connection with this id, or None if absent."""
+        return self._connections.pop(connection_id, None)
 
     def find(self, connection_id: str) -> Optional[Connection]:
-        for c in self._connections:
-            if c.connection_id == connection_id:
-                return c
-        return None
+        return self._connections.get(connection_id)
+
+    def clear(self) -> None:
+        """Drop all connections, keeping this manager instance for reuse."""
+        self._connections.clear()
+
+    def reset(self, connections: Optional[List[Connection]] = None) -> None:
+        """Replace the contents in place, reusing this manager instance."""
+        self._connections.clear()
+        for c in connections or []:
+            self._connections[c.connection_id] = c
 
     def all(self) -> List[Connection]:
-        return list(self._connections)
+        return list(self._connections.values())
 
     def __iter__(self):
-        return iter(self._connections)
+        return iter(self._connections.values())
 
     def __len__(self):
         return len(self._connections)
@@ -1,20 +1,21 @@
 """Service responsible for pedalboard lifecycle: create, load, save, snapshots."""
-from dataclasses import asdict
+import asyncio
 import uuid
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models.pedalboard import Pedalboard
 from ..models.connection import Connection
 from ..managers.connection_manager import ConnectionManager
 from ..infrastructure.utils import serialize_pedalboard
 from ..infrastructure.storage import save_pedalboard
+from ..services.event_emitter import EventEmitterMixin
 
 logger = logging.getLogger(__name__)
 
 
-class PedalboardManager:
+class PedalboardManager(EventEmitterMixin):
     """Manages a pedalboard instance and persistence.
 
     Does not directly interact with the modhost bridge; it uses a provided
@@ -22,12 +23,30 @@ class PedalboardManager:
     """
 
     def __init__(self, plugin_manager, bridge_client, zmq_service=None):
+        super().__init__(zmq_service)
         self.plugin_manager = plugin_manager
         self.bridge = bridge_client
-        self.zmq_service = zmq_service
 
         self.current_pedalboard: Optional[Pedalboard] = None
         self.connections = ConnectionManager([])
+        # (pedalboard, modified_at, serialized dict) for the last serialization
+        self._serialized_cache: Optional[Tuple[Pedalboard, datetime, Dict[str, Any]]] = None
+
+    def _serialized(self) -> Dict[str, Any]:
+        """Serialized view of the current pedalboard, reused until it is modified.
+
+        Each call returns a fresh top-level dict, so callers may add or replace
+        keys. Nested values (plugins, connections, metadata) are shared with
+        the cache and must be treated as read-only.
+        """
+        pb = self.current_pedalboard
+        if pb is None:
+            return {"pedalboard": None}
+        cache = self._serialized_cache
+        if cache is None or cache[0] is not pb or cache[1] != pb.modified_at:
+            cache = (pb, pb.modified_at, serialize_pedalboard(pb))
+            self._serialized_cache = cache
+        return dict(cache[2])
 
     async def create_pedalboard(self, name: str, description: str = "") -> Dict[str, Any]:
         pedalboard_id = str(uuid.uuid4())
@@ -35,14 +54,15 @@ class PedalboardManager:
         # Get available system inputs and outputs
         system_inputs, system_outputs = await self._discover_system_ports()
 
+        now = datetime.now()
         pb = Pedalboard(
             id=pedalboard_id,
             name=name,
             description=description,
             plugins=[],
             connections=[],
-            created_at=datetime.now(),
-            modified_at=datetime.now(),
+            created_at=now,
+            modified_at=now,
             metadata={},
             system_inputs=system_inputs,
             system_outputs=system_outputs,
@@ -50,24 +70,25 @@ class PedalboardManager:
 
         # reset state
         self.current_pedalboard = pb
-        self.connections = ConnectionManager([])
+        self.connections.reset()
 
-        if self.zmq_service:
-            await self.zmq_service.publish_event("pedalboard_created", {"id": pedalboard_id, "name": name, "description": description})
+        self._emit("pedalboard_created", {"id": pedalboard_id, "name": name, "description": description})
 
         logger.info("Created pedalboard: %s (%s) with inputs: %s, outputs: %s", name, pedalboard_id, system_inputs, system_outputs)
-        return {"pedalboard_id": pedalboard_id, "pedalboard": serialize_pedalboard(pb) if pb else {"pedalboard": None}}
+        return {"pedalboard_id": pedalboard_id, "pedalboard": self._serialized()}
 
     async def load_pedalboard(self, pedalboard_data: Dict[str, Any]) -> Dict[str, Any]:
         # Create pedalboard object
+        now = datetime.now()
+        saved_created_at = pedalboard_data.get("created_at")
         pedalboard = Pedalboard(
             id=pedalboard_data.get("id", str(uuid.uuid4())),
             name=pedalboard_data.get("name", "Untitled"),
             description=pedalboard_data.get("description", ""),
             plugins=pedalboard_data.get("plugins", []),
             connections=[Connection(**conn) if isinstance(conn, dict) else conn for conn in pedalboard_data.get("connections", [])],
-            created_at=datetime.fromisoformat(pedalboard_data.get("created_at", datetime.now().isoformat())),
-            modified_at=datetime.now(),
+            created_at=datetime.fromisoformat(saved_created_at) if saved_created_at else now,
+            modified_at=now,
             metadata=pedalboard_data.get("metadata", {}),
             system_inputs=pedalboard_data.get("system_inputs"),
             system_outputs=pedalboard_data.get("system_outputs"),
@@ -89,20 +110,19 @@ class PedalboardManager:
                 "System I/O mismatch on load: strategy=%s missing_inputs=%s missing_outputs=%s",
                 io_validation["strategy"], io_validation["missing_inputs"], io_validation["missing_outputs"],
             )
-            if self.zmq_service:
-                # Publish a concise event so UI/clients can react
-                await self.zmq_service.publish_event(
-                    "system_io_validation",
-                    {
-                        "pedalboard_id": pedalboard.id,
-                        "strategy": io_validation["strategy"],
-                        "missing_inputs": io_validation["missing_inputs"],
-                        "missing_outputs": io_validation["missing_outputs"],
-                        "resolved_inputs": io_validation["resolved_inputs"],
-                        "resolved_outputs": io_validation["resolved_outputs"],
-                    },
-                )
-        else:
+            # Publish a concise event so UI/clients can react
+            self._emit(
+                "system_io_validation",
+                {
+                    "pedalboard_id": pedalboard.id,
+                    "strategy": io_validation["strategy"],
+                    "missing_inputs": io_validation["missing_inputs"],
+                    "missing_outputs": io_validation["missing_outputs"],
+                    "resolved_inputs": io_validation["resolved_inputs"],
+                    "resolved_outputs": io_validation["resolved_outputs"],
+                },
+            )
+        elif logger.isEnabledFor(logging.DEBUG):
             inputs_count = len(pedalboard.system_inputs) if pedalboard.system_inputs else 0
             outputs_count = len(pedalboard.system_outputs) if pedalboard.system_outputs else 0
             logger.debug(
@@ -111,88 +131,113 @@ class PedalboardManager:
                 outputs_count,
             )
 
+        # Dispatch all plugin loads together; results come back in input order
+        # so the chain order (first/last plugin for system I/O) is preserved.
+        load_results = await asyncio.gather(
+            *(self._load_plugin_config(plugin_config) for plugin_config in pedalboard.plugins),
+            return_exceptions=True,
+        )
+
         loaded_plugins = []
         plugin_mapping = {}
-        for plugin_config in pedalboard.plugins:
-            try:
-                result = await self.plugin_manager.load_plugin(
-                    uri=plugin_config["uri"],
-                    x=plugin_config.get("x", 0.0),
-                    y=plugin_config.get("y", 0.0),
-                    parameters=plugin_config.get("parameters", {}),
-                )
-                old_id = plugin_config.get("instance_id")
-                new_id = result["instance_id"]
-                if old_id:
-                    plugin_mapping[old_id] = new_id
-                loaded_plugins.append({**plugin_config, "instance_id": new_id})
-            except Exception as e:
-                logger.error("Failed to load plugin %s: %s", plugin_config.get("uri"), e)
-
-        loaded_connections: List[Connection] = []
+        for plugin_config, result in zip(pedalboard.plugins, load_results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to load plugin %s: %s", plugin_config.get("uri"), result)
+                continue
+            old_id = plugin_config.get("instance_id")
+            new_id = result["instance_id"]
+            if old_id:
+                plugin_mapping[old_id] = new_id
+            loaded_plugins.append({**plugin_config, "instance_id": new_id})
+
+        # Seed identity entries so every endpoint lookup below is a plain index
         for connection in pedalboard.connections:
-            try:
-                source_plugin = plugin_mapping.get(connection.source_plugin, connection.source_plugin)
-                target_plugin = plugin_mapping.get(connection.target_plugin, connection.target_plugin)
-                result = await self.bridge.call("modhost_bridge", "create_connection", source_plugin=source_plugin, source_port=connection.source_port, target_plugin=target_plugin, target_port=connection.target_port)
-                if result.get("success", False):
-                    new_connection = Connection(source_plugin=source_plugin, source_port=connection.source_port, target_plugin=target_plugin, target_port=connection.target_port)
-                    loaded_connections.append(new_connection)
-                else:
-                    logger.error("Failed to create connection: %s", result.get("error", "Unknown error"))
-            except Exception as e:
-                logger.error("Failed to create connection: %s", e)
+            plugin_mapping.setdefault(connection.source_plugin, connection.source_plugin)
+            plugin_mapping.setdefault(connection.target_plugin, connection.target_plugin)
+        remapped = [
+            (plugin_mapping[c.source_plugin], c.source_port, plugin_mapping[c.target_plugin], c.target_port)
+            for c in pedalboard.connections
+        ]
+
+        # The bridge has no bulk connect command; dispatch the calls together
+        connect_results = await asyncio.gather(
+            *(
+                self.bridge.call("modhost_bridge", "create_connection", source_plugin=src, source_port=src_port, target_plugin=tgt, target_port=tgt_port)
+                for src, src_port, tgt, tgt_port in remapped
+            ),
+            return_exceptions=True,
+        )
+
+        connected = [not isinstance(r, BaseException) and r.get("success", False) for r in connect_results]
+        for ok, result in zip(connected, connect_results):
+            if not ok:
+                error = result if isinstance(result, BaseException) else result.get("error", "Unknown error")
+                logger.error("Failed to create connection: %s", error)
+        loaded_connections: List[Connection] = [
+            Connection(source_plugin=src, source_port=src_port, target_plugin=tgt, target_port=tgt_port)
+            for (src, src_port, tgt, tgt_port), ok in zip(remapped, connected)
+            if ok
+        ]
 
         pedalboard.plugins = loaded_plugins
         pedalboard.connections = loaded_connections
 
         self.current_pedalboard = pedalboard
-        self.connections = ConnectionManager(loaded_connections)
+        self.connections.reset(loaded_connections)
 
         # Setup system I/O connections if plugins are loaded
         io_result = {"system_io_connections": []}
         if loaded_plugins:
             io_result = await self.setup_system_io_connections()
 
-        if self.zmq_service:
-            await self.zmq_service.publish_event("pedalboard_loaded", {
-                "id": pedalboard.id,
-                "name": pedalboard.name,
-                "plugins_loaded": len(loaded_plugins),
-                "connections_created": len(loaded_connections),
-                "system_io_setup": io_result.get("status", "skipped")
-            })
+        self._emit("pedalboard_loaded", {
+            "id": pedalboard.id,
+            "name": pedalboard.name,
+            "plugins_loaded": len(loaded_plugins),
+            "connections_created": len(loaded_connections),
+            "system_io_setup": io_result.get("status", "skipped")
+        })
 
         logger.info("Loaded pedalboard: %s (%s) with system I/O: %s", pedalboard.name, pedalboard.id, io_result.get("status", "skipped"))
         return {
             "status": "ok",
-            "pedalboard": serialize_pedalboard(pedalboard) if pedalboard else {"pedalboard": None},
+            "pedalboard": self._serialized(),
             "plugins_loaded": len(loaded_plugins),
             "connections_created": len(loaded_connections),
             "system_io": io_result
         }
 
+    async def _load_plugin_config(self, plugin_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Load one saved plugin entry through the plugin manager."""
+        return await self.plugin_manager.load_plugin(
+            uri=plugin_config["uri"],
+            x=plugin_config.get("x", 0.0),
+            y=plugin_config.get("y", 0.0),
+            parameters=plugin_config.get("parameters", {}),
+        )
+
     async def save_pedalboard(self) -> Dict[str, Any]:
         if not self.current_pedalboard:
             raise ValueError("No pedalboard currently loaded")
 
         self.current_pedalboard.modified_at = datetime.now()
-        current_plugins = [asdict(instance) for instance in self.plugin_manager.instances.values()]
+        self._serialized_cache = None
+        current_plugins = [instance.to_dict() for instance in self.plugin_manager.instances.values()]
         self.current_pedalboard.plugins = current_plugins
         self.current_pedalboard.connections = self.connections.all()
 
         try:
-            pb_dict = serialize_pedalboard(self.current_pedalboard) if self.current_pedalboard else {"pedalboard": None}
-            pb_id, path = save_pedalboard(pb_dict)
+            pb_dict = self._serialized()
+            # Disk write runs in a worker thread so the event loop keeps serving RPCs
+            pb_id, path = await asyncio.to_thread(save_pedalboard, pb_dict)
         except Exception as e:
             logger.error("Failed to persist pedalboard: %s", e)
             raise
 
-        if self.zmq_service:
-            await self.zmq_service.publish_event("pedalboard_saved", {"id": self.current_pedalboard.id, "name": self.current_pedalboard.name, "saved_path": path})
+        self._emit("pedalboard_saved", {"id": self.current_pedalboard.id, "name": self.current_pedalboard.name, "saved_path": path})
 
         logger.info("Saved pedalboard: %s -> %s", self.current_pedalboard.name, path)
-        return {"status": "ok", "pedalboard": serialize_pedalboard(self.current_pedalboard) if self.current_pedalboard else {"pedalboard": None}, "saved_id": pb_id, "saved_path": path}
+        return {"status": "ok", "pedalboard": self._serialized(), "saved_id": pb_id, "saved_path": path}
 
     async def get_current_pedalboard(self, *, persist: bool = True) -> Dict[str, Any]:
         """Return current pedalboard. If persist is True (default) it triggers a save.
@@ -203,44 +248,56 @@ class PedalboardManager:
             return {"pedalboard": None}
         if persist:
             await self.save_pedalboard()
-        return {"pedalboard": serialize_pedalboard(self.current_pedalboard) if self.current_pedalboard else {"pedalboard": None}}
+        return {"pedalboard": self._serialized()}
 
     async def create_snapshot(self, name: str) -> Dict[str, Any]:
         if not self.current_pedalboard:
             raise ValueError("No pedalboard currently loaded")
         snapshot = {"id": str(uuid.uuid4()), "name": name, "created_at": datetime.now().isoformat(), "pedalboard_id": self.current_pedalboard.id, "plugin_states": {}}
-        for inst_id, instance in self.plugin_manager.instances.items():
-            snapshot["plugin_states"][inst_id] = instance.parameters.copy()
+        # Read-only parameter views shared copy-on-write with the plugin manager
+        for inst_id in self.plugin_manager.instances:
+            snapshot["plugin_states"][inst_id] = self.plugin_manager.share_parameters(inst_id)
         return {"status": "ok", "snapshot": snapshot}
 
     async def apply_snapshot(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
         if not self.current_pedalboard:
             raise ValueError("No pedalboard currently loaded")
-        applied_params = 0
+        instances = self.plugin_manager.instances
+        # An instance whose shared view is the snapshot's has not changed
+        # since the snapshot was taken, so its parameters need no RPCs; they
+        # still count as applied, since they already hold the snapshot's values.
+        targets = []
+        unchanged_params = 0
         for instance_id, parameters in snapshot.get("plugin_states", {}).items():
-            if instance_id in self.plugin_manager.instances:
-                for param, value in parameters.items():
-                    try:
-                        await self.plugin_manager.set_parameter(instance_id, param, value)
-                        applied_params += 1
-                    except Exception as e:
-                        logger.error("Failed to apply parameter %s.%s: %s", instance_id, param, e)
-        if self.zmq_service:
-            await self.zmq_service.publish_event("snapshot_applied", {"snapshot_id": snapshot.get("id"), "snapshot_name": snapshot.get("name"), "parameters_applied": applied_params})
+            if instance_id not in instances:
+                continue
+            if self.plugin_manager.is_current_share(instance_id, parameters):
+                unchanged_params += len(parameters)
+                continue
+            targets.extend((instance_id, param, value) for param, value in parameters.items())
+        results = await asyncio.gather(
+            *(self.plugin_manager.set_parameter(instance_id, param, value) for instance_id, param, value in targets),
+            return_exceptions=True,
+        )
+
+        applied_params = unchanged_params
+        for (instance_id, param, _), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to apply parameter %s.%s: %s", instance_id, param, result)
+            else:
+                applied_params += 1
+        self._emit("snapshot_applied", {"snapshot_id": snapshot.get("id"), "snapshot_name": snapshot.get("name"), "parameters_applied": applied_params})
         return {"status": "ok", "parameters_applied": applied_params}
 
     async def _discover_system_ports(self) -> tuple[list[str], list[str]]:
         """Discover available system input and output ports."""
         try:
-            # Get system input ports (captures)
-            inputs_result = (
-                await
-                self.bridge.call("modhost_bridge", "get_jack_hardware_ports", is_audio=True, is_output=False)
+            # Query system input ports (captures) and output ports (playbacks) together
+            inputs_result, outputs_result = await asyncio.gather(
+                self.bridge.call("modhost_bridge", "get_jack_hardware_ports", is_audio=True, is_output=False),
+                self.bridge.call("modhost_bridge", "get_jack_hardware_ports", is_audio=True, is_output=True),
             )
             system_inputs = inputs_result.get("ports", []) if inputs_result.get("success") else []
-
-            # Get system output ports (playbacks)
-            outputs_result = await self.bridge.call("modhost_bridge", "get_jack_hardware_ports", is_audio=True, is_output=True)
             system_outputs = outputs_result.get("ports", []) if outputs_result.get("success") else []
 
             # Default to standard stereo if discovery fails
@@ -267,41 +324,36 @@ class PedalboardManager:
         failed_connections = []
 
         # Get first and last plugins in the chain
-        first_plugin = self.current_pedalboard.plugins[0]
-        last_plugin = self.current_pedalboard.plugins[-1]
+        first_id = self.current_pedalboard.plugins[0]["instance_id"]
+        last_id = self.current_pedalboard.plugins[-1]["instance_id"]
 
         system_inputs = self.current_pedalboard.get_system_inputs()
         system_outputs = self.current_pedalboard.get_system_outputs()
 
-        # Connect system inputs to first plugin
-        for i, system_input in enumerate(system_inputs[:2]):  # Limit to stereo
-            try:
-                target_port = f"in_{i+1}" if i < len(system_inputs) else "in_1"
-                result = await self.bridge.call("modhost_bridge", "connect_jack_ports",
-                                              port1=system_input,
-                                              port2=f"{first_plugin['instance_id']}:{target_port}")
-                if result.get("success"):
-                    created_connections.append(f"{system_input} -> {first_plugin['instance_id']}:{target_port}")
-                else:
-                    failed_connections.append(f"{system_input} -> {first_plugin['instance_id']}:{target_port}")
-            except Exception as e:
-                logger.error("Failed to connect system input %s: %s", system_input, e)
-                failed_connections.append(f"{system_input} (error: {e})")
-
-        # Connect last plugin to system outputs
-        for i, system_output in enumerate(system_outputs[:2]):  # Limit to stereo
-            try:
-                source_port = f"out_{i+1}" if i < len(system_outputs) else "out_1"
-                result = await self.bridge.call("modhost_bridge", "connect_jack_ports",
-                                              port1=f"{last_plugin['instance_id']}:{source_port}",
-                                              port2=system_output)
-                if result.get("success"):
-                    created_connections.append(f"{last_plugin['instance_id']}:{source_port} -> {system_output}")
-                else:
-                    failed_connections.append(f"{last_plugin['instance_id']}:{source_port} -> {system_output}")
-            except Exception as e:
-                logger.error("Failed to connect system output %s: %s", system_output, e)
-                failed_connections.append(f"{system_output} (error: {e})")
+        # (port1, port2, system port) for every link, limited to stereo;
+        # system inputs feed the first plugin, the last plugin feeds the outputs
+        links = [
+            (system_input, f"{first_id}:in_{i}", system_input)
+            for i, system_input in enumerate(system_inputs[:2], start=1)
+        ]
+        links += [
+            (f"{last_id}:out_{i}", system_output, system_output)
+            for i, system_output in enumerate(system_outputs[:2], start=1)
+        ]
+
+        results = await asyncio.gather(
+            *(self.bridge.call("modhost_bridge", "connect_jack_ports", port1=port1, port2=port2) for port1, port2, _ in links),
+            return_exceptions=True,
+        )
+
+        for (port1, port2, system_port), result in zip(links, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to connect system port %s: %s", system_port, result)
+                failed_connections.append(f"{system_port} (error: {result})")
+            elif result.get("success"):
+                created_connections.append(f"{port1} -> {port2}")
+            else:
+                failed_connections.append(f"{port1} -> {port2}")
 
         logger.info("System I/O setup: %d connections created, %d failed", len(created_connections), len(failed_connections))
 
@@ -330,10 +382,30 @@ class PedalboardManager:
 
         Returns a dict describing differences and the resolved ports to use.
         """
-        missing_inputs = [p for p in saved_inputs if p not in current_inputs]
-        missing_outputs = [p for p in saved_outputs if p not in current_outputs]
-        extra_inputs = [p for p in current_inputs if p not in saved_inputs]
-        extra_outputs = [p for p in current_outputs if p not in saved_outputs]
+        # Fast path: saved ports match current hardware exactly (the common case)
+        if saved_inputs and saved_inputs == current_inputs and saved_outputs == current_outputs:
+            return {
+                "saved_inputs": saved_inputs,
+                "saved_outputs": saved_outputs,
+                "current_inputs": current_inputs,
+                "current_outputs": current_outputs,
+                "missing_inputs": [],
+                "missing_outputs": [],
+                "extra_inputs": [],
+                "extra_outputs": [],
+                "strategy": "kept_saved",
+                "resolved_inputs": saved_inputs,
+                "resolved_outputs": saved_outputs,
+                "changed": False,
+            }
+
+        # Hashed membership; the comprehensions keep the original list order
+        current_in_set, current_out_set = set(current_inputs), set(current_outputs)
+        saved_in_set, saved_out_set = set(saved_inputs), set(saved_outputs)
+        missing_inputs = [p for p in saved_inputs if p not in current_in_set]
+        missing_outputs = [p for p in saved_outputs if p not in current_out_set]
+        extra_inputs = [p for p in current_inputs if p not in saved_in_set]
+        extra_outputs = [p for p in current_outputs if p not in saved_out_set]
 
         # Decide strategy
         if saved_inputs == [] and saved_outputs == []:
@@ -370,9 +442,17 @@ class PedalboardManager:
             "changed": changed,
         }
 
+    def clear(self) -> None:
+        """Forget the current pedalboard and its connections (in-memory only)."""
+        self.current_pedalboard = None
+        self.connections.clear()
+        self._serialized_cache = None
+
     # connection helpers
     def add_connection(self, connection: Connection) -> None:
         self.connections.append(connection)
+        self._serialized_cache = None
 
     def remove_connection(self, connection_id: str) -> bool:
+        self._serialized_cache = None
         return self.connections.remove(connection_id)
@@ -8,7 +8,8 @@ import asyncio
 import logging
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,29 @@ class PluginInstance:
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view of this instance.
+
+        Cheaper than dataclasses.asdict, which deep-copies every nested
+        dict. Only the mutable parameter values are copied; ports and
+        available_parameters are static plugin metadata.
+        """
+        return {
+            "uri": self.uri,
+            "instance_id": self.instance_id,
+            "name": self.name,
+            "brand": self.brand,
+            "version": self.version,
+            "parameters": dict(self.parameters),
+            "ports": self.ports,
+            "available_parameters": self.available_parameters,
+            "x": self.x,
+            "y": self.y,
+            "enabled": self.enabled,
+            "preset": self.preset,
+            "created_at": self.created_at,
+        }
+
 
 class PluginManager:
     """Manages plugin loading, unloading, and parameter control"""
@@ -48,19 +72,37 @@ class PluginManager:
         self.instances: Dict[str, PluginInstance] = {}
         self.available_plugins: Dict[str, Dict[str, Any]] = {}
         self._lock = asyncio.Lock()
-
-    async def initialize(self):
-        """Initialize plugin manager"""
+        self._change_listeners: List[Callable[[], None]] = []
+        # Read-only views of parameter dicts currently referenced by a
+        # snapshot, by instance; set_parameter copies the dict before the
+        # next write.
+        self._shared_parameters: Dict[str, MappingProxyType] = {}
+
+    async def initialize(self, skip_scan: bool = False):
+        """Initialize plugin manager
+
+        skip_scan=True leaves available_plugins empty instead of querying the
+        bridge, for callers (e.g. storage tests) that never look plugins up.
+        """
         logger.info("Initializing plugin manager")
 
         # Load available plugins
-        await self._load_available_plugins()
+        if not skip_scan:
+            await self._load_available_plugins()
 
         logger.info(
             "Plugin manager initialized with %s available plugins",
             len(self.available_plugins),
         )
 
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked whenever the set of instances changes."""
+        self._change_listeners.append(callback)
+
+    def _notify_change(self) -> None:
+        for callback in self._change_listeners:
+            callback()
+
     async def _publish_event(self, event_name: str, payload: Dict[str, Any]):
         """Publish an event to the ZMQ service (best-effort)."""
         if not self.zmq_service:
@@ -71,6 +113,21 @@ class PluginManager:
         except Exception:
             logger.debug("Failed to publish event %s", event_name)
 
+    async def _publish_batch(self, events: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Publish several events in one go (best-effort)."""
+        if not self.zmq_service:
+            return
+
+        events = list(events)
+        try:
+            sent = await self.zmq_service.publish_batch(events)
+        except Exception:
+            logger.debug("Failed to publish %d batched events", len(events))
+            return
+        for (event_name, _), ok in zip(events, sent):
+            if not ok:
+                logger.debug("Failed to publish event %s", event_name)
+
     async def _load_available_plugins(self):
         """Load list of available plugins from bridge service"""
         try:
@@ -106,140 +163,158 @@ class PluginManager:
         parameters: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
         """Load a plugin instance"""
-        async with self._lock:
-            # Check if plugin exists
-            if uri not in self.available_plugins:
-                raise ValueError(f"Plugin not found: {uri}")
-
-            plugin_info = self.available_plugins[uri]
-
-            # Ask the bridge to create the instance. The bridge (C++ side)
-            # generates its own canonical instance_id and returns it in the
-            # response. Use that instance id so both components agree on the
-            # identity of the plugin.
-            result = await self.bridge.call(
-                "modhost_bridge",
-                "load_plugin",
-                uri=uri,
-                x=x,
-                y=y,
-                parameters=parameters or {},
-            )
+        # Check if plugin exists
+        if uri not in self.available_plugins:
+            raise ValueError(f"Plugin not found: {uri}")
+
+        plugin_info = self.available_plugins[uri]
+
+        # Ask the bridge to create the instance. The bridge (C++ side)
+        # generates its own canonical instance_id and returns it in the
+        # response. Use that instance id so both components agree on the
+        # identity of the plugin.
+        result = await self.bridge.call(
+            "modhost_bridge",
+            "load_plugin",
+            uri=uri,
+            x=x,
+            y=y,
+            parameters=parameters or {},
+        )
 
-            # Check for error or missing instance id
-            if "error" in result:
-                raise RuntimeError(f"Failed to add plugin to bridge: {result.get('error', 'Unknown error')}")
-            if not result.get("success", True):
-                raise RuntimeError(f"Failed to add plugin to bridge: {result.get('error', 'Unknown error')}")
-
-            instance_id = result.get("instance_id")
-            if not instance_id:
-                raise RuntimeError("Bridge did not return an instance_id for the loaded plugin")
-
-            # Verify the bridge actually registered the instance. This avoids
-            # transient races where the bridge may take a short moment to
-            # publish the new instance internally. Poll get_plugin_info for a
-            # short period (10 seconds) before giving up.
-            verified = False
-            max_attempts = 100
-            for attempt in range(max_attempts):
-                verify = await self.bridge.call("modhost_bridge", "get_plugin_info", instance_id=instance_id)
-                if verify and not verify.get("error") and verify.get("success", True):
-                    verified = True
-                    break
-                # small backoff
-                await asyncio.sleep(0.1)
-
-            if not verified:
-                raise RuntimeError(f"Bridge did not register plugin instance within timeout: {instance_id}")
-
-            # Get plugin essentials (parameters, etc.)
-            essentials = await self.get_plugin_essentials(uri)
-            logger.debug("Plugin essentials for %s: %s", uri, essentials)
-            available_parameters = {}
-
-            # The bridge may expose parameters under several keys depending on
-            # the plugin scanner: 'parameters' (canonical), or LV2-specific
-            # lists like 'control_inputs' / 'control_outputs'. Collect entries
-            # from all likely locations and treat items with a symbol as valid
-            # even if the 'valid' flag is missing.
-            candidates = []
-            if isinstance(essentials, dict):
-                candidates.extend(essentials.get("parameters", []))
-                candidates.extend(essentials.get("control_inputs", []))
-                candidates.extend(essentials.get("control_outputs", []))
-
-            for param in candidates:
-                # If 'valid' is present, obey it; otherwise consider present
-                # symbols as valid parameters
-                has_symbol = bool(param.get("symbol") or param.get("name") or param.get("short_name"))
-                is_valid = param.get("valid") if ("valid" in param) else has_symbol
-                if not is_valid:
-                    continue
-
-                # Prefer explicit symbol, fall back to name/short_name/label
-                param_symbol = param.get("symbol") or param.get("name") or param.get("short_name") or param.get("label")
-                if param_symbol:
-                    available_parameters[param_symbol] = param
-
-            # Create plugin instance
-            instance = PluginInstance(
-                uri=uri,
-                instance_id=instance_id,
-                name=plugin_info.get("name", "Unknown"),
-                brand=plugin_info.get("brand", "Unknown"),
-                version=plugin_info.get("version", "1.0"),
-                parameters=parameters or {},
-                ports=plugin_info.get("ports", {}),
-                available_parameters=available_parameters,
-                x=x,
-                y=y,
-            )
+        # Check for error or missing instance id
+        if "error" in result:
+            raise RuntimeError(f"Failed to add plugin to bridge: {result.get('error', 'Unknown error')}")
+        if not result.get("success", True):
+            raise RuntimeError(f"Failed to add plugin to bridge: {result.get('error', 'Unknown error')}")
+
+        instance_id = result.get("instance_id")
+        if not instance_id:
+            raise RuntimeError("Bridge did not return an instance_id for the loaded plugin")
+
+        # Verify the bridge actually registered the instance. This avoids
+        # transient races where the bridge may take a short moment to
+        # publish the new instance internally. Poll get_plugin_info for a
+        # short period (10 seconds) before giving up.
+        verified = False
+        max_attempts = 100
+        for attempt in range(max_attempts):
+            verify = await self.bridge.call("modhost_bridge", "get_plugin_info", instance_id=instance_id)
+            if verify and not verify.get("error") and verify.get("success", True):
+                verified = True
+                break
+            # small backoff
+            await asyncio.sleep(0.1)
+
+        if not verified:
+            raise RuntimeError(f"Bridge did not register plugin instance within timeout: {instance_id}")
+
+        # Get plugin essentials (parameters, etc.)
+        essentials = await self.get_plugin_essentials(uri)
+        logger.debug("Plugin essentials for %s: %s", uri, essentials)
+        available_parameters = {}
+
+        # The bridge may expose parameters under several keys depending on
+        # the plugin scanner: 'parameters' (canonical), or LV2-specific
+        # lists like 'control_inputs' / 'control_outputs'. Collect entries
+        # from all likely locations and treat items with a symbol as valid
+        # even if the 'valid' flag is missing.
+        candidates = []
+        if isinstance(essentials, dict):
+            candidates.extend(essentials.get("parameters", []))
+            candidates.extend(essentials.get("control_inputs", []))
+            candidates.extend(essentials.get("control_outputs", []))
+
+        for param in candidates:
+            # If 'valid' is present, obey it; otherwise consider present
+            # symbols as valid parameters
+            has_symbol = bool(param.get("symbol") or param.get("name") or param.get("short_name"))
+            is_valid = param.get("valid") if ("valid" in param) else has_symbol
+            if not is_valid:
+                continue
+
+            # Prefer explicit symbol, fall back to name/short_name/label
+            param_symbol = param.get("symbol") or param.get("name") or param.get("short_name") or param.get("label")
+            if param_symbol:
+                available_parameters[param_symbol] = param
+
+        # Create plugin instance
+        instance = PluginInstance(
+            uri=uri,
+            instance_id=instance_id,
+            name=plugin_info.get("name", "Unknown"),
+            brand=plugin_info.get("brand", "Unknown"),
+            version=plugin_info.get("version", "1.0"),
+            # Copied so the caller's dict never aliases instance state
+            parameters=dict(parameters or {}),
+            ports=plugin_info.get("ports", {}),
+            available_parameters=available_parameters,
+            x=x,
+            y=y,
+        )
 
-            # Note: initial parameters were passed to the bridge when loading
-            # the plugin; the bridge will apply them to the mod-host. Avoid
-            # double-applying them here.
+        # Note: initial parameters were passed to the bridge when loading
+        # the plugin; the bridge will apply them to the mod-host. Avoid
+        # double-applying them here.
 
-            # Store instance
+        # Store instance. Only the registry update needs the lock, so several
+        # loads can have their bridge round-trips in flight at once.
+        async with self._lock:
             self.instances[instance_id] = instance
+            self._notify_change()
 
-            # Publish event (support service bus API compatibility)
-            # Best-effort publish; don't fail the operation on publish errors
-            await self._publish_event(
-                "plugin_loaded",
-                {"instance_id": instance_id, "uri": uri, "name": instance.name},
-            )
+        # Publish event (support service bus API compatibility)
+        # Best-effort publish; don't fail the operation on publish errors
+        await self._publish_event(
+            "plugin_loaded",
+            {"instance_id": instance_id, "uri": uri, "name": instance.name},
+        )
+
+        logger.info("Loaded plugin %s as %s", uri, instance_id)
 
-            logger.info("Loaded plugin %s as %s", uri, instance_id)
+        # Convert to JSON-serializable dict (convert datetimes to isoformat)
+        plugin_dict = asdict(instance)
+        return {"instance_id": instance_id, "plugin": plugin_dict}
 
-            # Convert to JSON-serializable dict (convert datetimes to isoformat)
-            plugin_dict = asdict(instance)
-            return {"instance_id": instance_id, "plugin": plugin_dict}
+    async def load_plugins(self, specs: Iterable[Tuple[str, float, float]]) -> List[Dict[str, Any]]:
+        """Load several plugin instances concurrently.
+
+        Each spec is a (uri, x, y) tuple; results come back in spec order.
+        The bridge assigns instance ids, so concurrent loads cannot collide.
+        """
+        return list(await asyncio.gather(*(self.load_plugin(uri, x, y) for uri, x, y in specs)))
 
     async def unload_plugin(self, instance_id: str) -> Dict[str, Any]:
         """Unload a plugin instance"""
+        # Claim the instance under the lock, then talk to the bridge outside
+        # it so several unloads can be in flight at once (as with loads).
         async with self._lock:
-            if instance_id not in self.instances:
+            instance = self.instances.pop(instance_id, None)
+            if instance is None:
                 raise ValueError(f"Plugin instance not found: {instance_id}")
+            self._shared_parameters.pop(instance_id, None)
+            self._notify_change()
 
-            instance = self.instances[instance_id]
-
-            # Remove from bridge service
+        # Remove from bridge service
+        try:
             result = await self.bridge.call("modhost_bridge", "unload_plugin", instance_id=instance_id)
-            if not result.get("success", False):
-                logger.warning("Failed to remove plugin %s from bridge: %s", instance_id, result.get("error", "Unknown error"))
-
-            # Remove from instances
-            del self.instances[instance_id]
+        except BaseException:
+            # Put the instance back so the registry still matches the bridge
+            async with self._lock:
+                self.instances[instance_id] = instance
+                self._notify_change()
+            raise
+        if not result.get("success", False):
+            logger.warning("Failed to remove plugin %s from bridge: %s", instance_id, result.get("error", "Unknown error"))
 
-            # Publish event (support service bus API compatibility)
-            await self._publish_event(
-                "plugin_unloaded", {"instance_id": instance_id, "uri": instance.uri}
-            )
+        # Publish event (support service bus API compatibility)
+        await self._publish_event(
+            "plugin_unloaded", {"instance_id": instance_id, "uri": instance.uri}
+        )
 
-            logger.info("Unloaded plugin %s", instance_id)
+        logger.info("Unloaded plugin %s", instance_id)
 
-            return {"status": "ok", "instance_id": instance_id}
+        return {"status": "ok", "instance_id": instance_id}
 
     async def set_parameter(
         self, instance_id: str, parameter: str, value: float
@@ -260,7 +335,9 @@ class PluginManager:
         if not result.get("success", False):
             raise RuntimeError(f"Failed to set parameter in bridge: {result.get('error', 'Unknown error')}")
 
-        # Update local state
+        # Update local state (copy first if a snapshot shares the dict)
+        if self._shared_parameters.pop(instance_id, None) is not None:
+            instance.parameters = dict(instance.parameters)
         instance.parameters[parameter] = value
 
         # Publish event (support service bus API compatibility)
@@ -289,6 +366,28 @@ class PluginManager:
 
         return {"parameter": parameter, "value": value}
 
+    def share_parameters(self, instance_id: str) -> Mapping[str, Any]:
+        """Return a read-only view of an instance's parameters for snapshots.
+
+        The underlying dict is copied on the next set_parameter call, so the
+        view keeps the values it had at the time of sharing. Until then every
+        call returns the same view.
+        """
+        # Copy-on-write contract: set_parameter is the only writer of
+        # instance.parameters and copies a shared dict before changing it.
+        # Any new code that writes to that dict in place must do the same,
+        # or it silently changes stored snapshots, and apply_snapshot (which
+        # skips instances whose shared view is still current) stops restoring them.
+        view = self._shared_parameters.get(instance_id)
+        if view is None:
+            view = MappingProxyType(self.instances[instance_id].parameters)
+            self._shared_parameters[instance_id] = view
+        return view
+
+    def is_current_share(self, instance_id: str, parameters: Mapping[str, Any]) -> bool:
+        """True if parameters is the view share_parameters would return now."""
+        return self._shared_parameters.get(instance_id) is parameters
+
     async def get_plugin_info(self, instance_id: str) -> Dict[str, Any]:
         """Get plugin instance information"""
         if instance_id not in self.instances:
@@ -306,13 +405,40 @@ class PluginManager:
         return {"instances": instances}
 
     async def clear_all(self):
-        """Unload all plugin instances"""
-        instance_ids = list(self.instances.keys())
-        for instance_id in instance_ids:
-            try:
-                await self.unload_plugin(instance_id)
-            except Exception as e:
-                logger.error("Error unloading plugin %s: %s", instance_id, e)
+        """Unload all plugin instances.
+
+        Uses the bridge's single clear_all command; falls back to unloading
+        instances one by one if the bulk command fails.
+        """
+        if not self.instances:
+            return
+
+        try:
+            result = await self.bridge.call("modhost_bridge", "clear_all")
+            cleared = not result.get("error") and result.get("success", True)
+        except Exception as e:
+            logger.warning("Bulk clear_all failed, unloading plugins individually: %s", e)
+            cleared = False
+
+        if cleared:
+            async with self._lock:
+                removed = list(self.instances.values())
+                self.instances.clear()
+                self._shared_parameters.clear()
+                self._notify_change()
+            await self._publish_batch(
+                ("plugin_unloaded", {"instance_id": instance.instance_id, "uri": instance.uri})
+                for instance in removed
+            )
+        else:
+            instance_ids = list(self.instances.keys())
+            results = await asyncio.gather(
+                *(self.unload_plugin(instance_id) for instance_id in instance_ids),
+                return_exceptions=True,
+            )
+            for instance_id, result in zip(instance_ids, results):
+                if isinstance(result, BaseException):
+                    logger.error("Error unloading plugin %s: %s", instance_id, result)
 
         logger.info("Cleared all plugin instances")
 
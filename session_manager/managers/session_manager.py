@@ -41,40 +41,56 @@ class SessionManager:
         # Simplified locking for session-level operations only
         self._lock = asyncio.Lock()
 
+        # Cached get_status() result, rebuilt only after a mutation
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_dirty = True
+        plugin_manager.add_change_listener(self._invalidate_status)
+
+    def _invalidate_status(self) -> None:
+        """Mark the cached status as stale"""
+        self._status_dirty = True
+
     async def create_pedalboard(
         self, name: str, description: str = ""
     ) -> Dict[str, Any]:
         """Create a new empty pedalboard"""
         async with self._lock:
-            # Clear current audio state
-            await self.session_control._clear_audio_state()
+            try:
+                # Clear current audio state
+                await self.session_control._clear_audio_state()
 
-            # Delegate to pedalboard service - it handles all state management
-            result = await self.pedalboard_service.create_pedalboard(name, description)
+                # Delegate to pedalboard service - it handles all state management
+                result = await self.pedalboard_service.create_pedalboard(name, description)
 
-            # Reset connections
-            self.connection_service.clear_connections()
+                # Reset connections
+                self.connection_service.clear_connections()
 
-            return result
+                return result
+            finally:
+                self._invalidate_status()
 
     async def load_pedalboard(self, pedalboard_data: Dict[str, Any]) -> Dict[str, Any]:
         """Load a pedalboard from configuration data"""
         async with self._lock:
-            # Clear current state
-            await self.session_control._clear_audio_state()
+            try:
+                # Clear current state
+                await self.session_control._clear_audio_state()
 
-            # Delegate to pedalboard service - it handles all state management
-            result = await self.pedalboard_service.load_pedalboard(pedalboard_data)
+                # Delegate to pedalboard service - it handles all state management
+                result = await self.pedalboard_service.load_pedalboard(pedalboard_data)
 
-            # Sync connections from pedalboard service
-            self.connection_service.connections = self.pedalboard_service.connections
+                # Sync connections from pedalboard service (copied, not aliased,
+                # so connection_service updates are not applied twice)
+                self.connection_service.connections.reset(self.pedalboard_service.connections.all())
 
-            return result
+                return result
+            finally:
+                self._invalidate_status()
 
     async def save_pedalboard(self) -> Dict[str, Any]:
         """Save current pedalboard state (persist to disk)."""
         # Sync current connection state to pedalboard service
-        self.pedalboard_service.connections = self.connection_service.connections
+        self.pedalboard_service.connections.reset(self.connection_service.connections.all())
 
         # Delegate to pedalboard service - it validates and saves
         return await self.pedalboard_service.save_pedalboard()
@@ -91,14 +107,18 @@ class SessionManager:
     ) -> Dict[str, Any]:
         """Create a connection between plugins"""
         # Delegate to connection service - it handles validation and creation
-        return await self.connection_service.create_connection(
+        result = await self.connection_service.create_connection(
             source_plugin, source_port, target_plugin, target_port
         )
+        self._invalidate_status()
+        return result
 
     async def remove_connection(self, connection_id: str) -> Dict[str, Any]:
         """Remove a connection"""
         # Delegate to connection service
-        return await self.connection_service.remove_connection(connection_id)
+        result = await self.connection_service.remove_connection(connection_id)
+        self._invalidate_status()
+        return result
 
     async def create_snapshot(self, name: str) -> Dict[str, Any]:
         """Create a snapshot of current state"""
@@ -114,7 +134,10 @@ class SessionManager:
     async def reset_session(self, bank_id: Optional[str] = None) -> Dict[str, Any]:
         """Reset entire session state"""
         async with self._lock:
-            return await self.session_control.reset_session(bank_id)
+            try:
+                return await self.session_control.reset_session(bank_id)
+            finally:
+                self._invalidate_status()
 
     async def mute_session(self) -> Dict[str, Any]:
         """Mute audio output"""
@@ -131,14 +154,24 @@ class SessionManager:
     async def initialize_session(self) -> Dict[str, Any]:
         """Initialize session"""
         async with self._lock:
-            return await self.session_control.initialize_session()
+            try:
+                return await self.session_control.initialize_session()
+            finally:
+                self._invalidate_status()
+
+    async def close(self) -> None:
+        """Flush pending work before shutdown"""
+        await asyncio.gather(self.pedalboard_service.close(), self.connection_service.close())
 
     def get_status(self) -> Dict[str, Any]:
-        """Get session manager status"""
-        current_pb = self.pedalboard_service.current_pedalboard
-        return {
-            "current_pedalboard": current_pb.name if current_pb else None,
-            "pedalboard_id": current_pb.id if current_pb else None,
-            "active_connections": len(self.connection_service.connections),
-            "loaded_plugins": len(self.plugin_manager.instances),
-        }
+        """Get session manager status (cached until the next mutation)"""
+        if self._status_dirty or self._status_cache is None:
+            current_pb = self.pedalboard_service.current_pedalboard
+            self._status_cache = {
+                "current_pedalboard": current_pb.name if current_pb else None,
+                "pedalboard_id": current_pb.id if current_pb else None,
+                "active_connections": len(self.connection_service.connections),
+                "loaded_plugins": len(self.plugin_manager.instances),
+            }
+            self._status_dirty = False
+        return dict(self._status_cache)
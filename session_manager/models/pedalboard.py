@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 from .connection import Connection
 
 
-@dataclass
+@dataclass(slots=True)
 class Pedalboard:
     """Represents a complete pedalboard configuration with helpers.
 
@@ -65,12 +65,16 @@ class Pedalboard:
         return removed
 
     def set_system_inputs(self, inputs: List[str]) -> None:
-        """Set system input ports for this pedalboard."""
+        """Set system input ports for this pedalboard (no-op if unchanged)."""
+        if self.system_inputs == (inputs or []):
+            return
         self.system_inputs = inputs.copy() if inputs else []
         self.modified_at = datetime.now()
 
     def set_system_outputs(self, outputs: List[str]) -> None:
-        """Set system output ports for this pedalboard."""
+        """Set system output ports for this pedalboard (no-op if unchanged)."""
+        if self.system_outputs == (outputs or []):
+            return
         self.system_outputs = outputs.copy() if outputs else []
         self.modified_at = datetime.now()
 
@@ -5,11 +5,12 @@ from dataclasses import asdict
 
 from ..models.connection import Connection
 from ..managers.connection_manager import ConnectionManager
+from .event_emitter import EventEmitterMixin
 
 logger = logging.getLogger(__name__)
 
 
-class ConnectionService:
+class ConnectionService(EventEmitterMixin):
     """Manages audio connections between plugins.
 
     Handles creation, removal, and listing of connections.
@@ -17,10 +18,10 @@ class ConnectionService:
     """
 
     def __init__(self, bridge_client, pedalboard_service, plugin_manager, zmq_service=None):
+        super().__init__(zmq_service)
         self.bridge = bridge_client
         self.pedalboard_service = pedalboard_service
         self.plugin_manager = plugin_manager
-        self.zmq_service = zmq_service
         self.connections = ConnectionManager([])
 
     async def create_connection(
@@ -57,15 +58,14 @@ class ConnectionService:
             self.pedalboard_service.add_connection(connection)
 
         # Publish event
-        if self.zmq_service:
-            await self.zmq_service.publish_event(
-                "connection_created",
-                {
-                    "connection_id": connection.connection_id,
-                    "source": f"{source_plugin}:{source_port}",
-                    "target": f"{target_plugin}:{target_port}",
-                },
-            )
+        self._emit(
+            "connection_created",
+            {
+                "connection_id": connection.connection_id,
+                "source": f"{source_plugin}:{source_port}",
+                "target": f"{target_plugin}:{target_port}",
+            },
+        )
 
         logger.info(
             "Created connection: %s:%s -> %s:%s",
@@ -82,9 +82,8 @@ class ConnectionService:
 
     async def remove_connection(self, connection_id: str) -> Dict[str, Any]:
         """Remove a connection"""
-        # Find connection
-        connection = self.connections.find(connection_id)
-        if not connection:
+        # Find and drop the connection in one keyed lookup
+        if self.connections.pop(connection_id) is None:
             raise ValueError(f"Connection not found: {connection_id}")
 
         # Disconnect via bridge
@@ -95,18 +94,12 @@ class ConnectionService:
         except Exception as e:
             logger.warning("Failed to disconnect in mod-host: %s (%s)", connection_id, e)
 
-        # Remove from connections
-        self.connections.remove(connection)
-
         # Update pedalboard if loaded
         if self.pedalboard_service.current_pedalboard:
             self.pedalboard_service.remove_connection(connection_id)
 
         # Publish event
-        if self.zmq_service:
-            await self.zmq_service.publish_event(
-                "connection_removed", {"connection_id": connection_id}
-            )
+        self._emit("connection_removed", {"connection_id": connection_id})
 
         logger.info("Removed connection %s", connection_id)
 
@@ -117,5 +110,5 @@ class ConnectionService:
         return self.connections.all()
 
     def clear_connections(self):
-        """Clear all connections"""
-        self.connections = ConnectionManager([])
\ No newline at end of file
+        """Clear all connections (reuses the existing manager instead of reallocating)"""
+        self.connections.clear()
\ No newline at end of file
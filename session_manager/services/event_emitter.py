@@ -0,0 +1,29 @@
+"""Fire-and-forget event publishing shared by the managers and services."""
+import asyncio
+from typing import Any, Dict, Set
+
+
+class EventEmitterMixin:
+    """Publishes events through ``zmq_service`` without making callers wait.
+
+    Classes using it call ``super().__init__(zmq_service)`` and await
+    ``close()`` on shutdown so no queued event is lost.
+    """
+
+    def __init__(self, zmq_service=None):
+        self.zmq_service = zmq_service
+        # In-flight fire-and-forget publish tasks (kept so they are not GC'd)
+        self._pending: Set[asyncio.Task] = set()
+
+    def _emit(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Publish an event without making the caller wait for the send."""
+        if not self.zmq_service:
+            return
+        task = asyncio.create_task(self.zmq_service.publish_event(event_type, data))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def close(self) -> None:
+        """Wait for any events still being published."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
@@ -6,16 +6,18 @@ Provides RPC (REQ/REP) and pub/sub functionality.
 """
 
 import asyncio
-import json
 import logging
+import os
 import uuid
 import zlib
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import zmq
 import zmq.asyncio
 
+from ..infrastructure.json_codec import dumps as _dumps, loads as _loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,16 +26,22 @@ class ZMQService:
     Direct ZeroMQ service for RPC and pub/sub communication
     """
 
-    def __init__(self, service_name: str, base_port: int = 5555):
+    # Upper bound on RPC calls handled concurrently
+    MAX_CONCURRENT_RPC = 32
+
+    def __init__(self, service_name: str, base_port: Optional[int] = None):
         self.service_name = service_name
-        self.base_port = base_port
-        self.context = zmq.asyncio.Context()
+        # ZMQ_BASE_PORT lets parallel test workers use disjoint port ranges
+        self.base_port = base_port if base_port is not None else int(os.getenv("ZMQ_BASE_PORT", "5555"))
+        # Process-wide context shared with other services and the bridge client
+        self.context = zmq.asyncio.Context.instance()
 
         # Sockets
         self.rpc_socket = None  # REP socket for handling incoming RPC calls
         self.pub_socket = None  # PUB socket for publishing events
         self.sub_socket = None  # SUB socket for subscribing to events
         self.req_sockets = {}  # REQ sockets for calling other services
+        self._req_locks: Dict[str, asyncio.Lock] = {}  # one in-flight request per REQ socket
 
         # Handlers
         self._handlers: Dict[str, Callable] = {}
@@ -41,6 +49,9 @@ class ZMQService:
         # State
         self._running = False
         self._tasks: List[asyncio.Task] = []
+        # Per-call RPC handler tasks, bounded by _rpc_slots
+        self._rpc_tasks: Set[asyncio.Task] = set()
+        self._rpc_slots = asyncio.Semaphore(self.MAX_CONCURRENT_RPC)
 
         # Assign ports based on service name hash
         self._assign_ports()
@@ -60,13 +71,14 @@ class ZMQService:
     async def start(self) -> bool:
         """Start the ZeroMQ service"""
         try:
-            # RPC socket (REP) - handles incoming method calls
-            self.rpc_socket = self.context.socket(zmq.REP)
-            self.rpc_socket.bind(f"tcp://127.0.0.1:{self.rpc_port}")
+            # RPC socket (ROUTER) - handles incoming method calls; unlike REP it
+            # lets several calls be in progress at once
+            self.rpc_socket = self.context.socket(zmq.ROUTER)
+            await self._bind(self.rpc_socket, f"tcp://127.0.0.1:{self.rpc_port}")
 
             # PUB socket - publishes events
             self.pub_socket = self.context.socket(zmq.PUB)
-            self.pub_socket.bind(f"tcp://127.0.0.1:{self.pub_port}")
+            await self._bind(self.pub_socket, f"tcp://127.0.0.1:{self.pub_port}")
 
             # SUB socket - subscribes to events from other services
             self.sub_socket = self.context.socket(zmq.SUB)
@@ -95,12 +107,29 @@ class ZMQService:
             await self.stop()
             return False
 
+    @staticmethod
+    async def _bind(socket, addr: str, attempts: int = 50) -> None:
+        """Bind, retrying briefly while a just-closed socket still holds the port.
+
+        The shared context is not terminated on stop(), and libzmq releases a
+        closed socket's port asynchronously, so an immediate restart can race it.
+        """
+        for _ in range(attempts - 1):
+            try:
+                socket.bind(addr)
+                return
+            except zmq.ZMQError as e:
+                if e.errno != zmq.EADDRINUSE:
+                    raise
+                await asyncio.sleep(0.01)
+        socket.bind(addr)
+
     async def stop(self):
         """Stop the ZeroMQ service"""
         self._running = False
 
         # Cancel tasks
-        for task in self._tasks:
+        for task in [*self._tasks, *self._rpc_tasks]:
             if not task.done():
                 task.cancel()
                 try:
@@ -108,20 +137,18 @@ class ZMQService:
                 except asyncio.CancelledError:
                     pass
 
-        # Close sockets
+        # Close sockets (the shared context stays up for other users)
         if self.rpc_socket:
-            self.rpc_socket.close()
+            self.rpc_socket.close(linger=0)
         if self.pub_socket:
-            self.pub_socket.close()
+            self.pub_socket.close(linger=0)
         if self.sub_socket:
-            self.sub_socket.close()
+            self.sub_socket.close(linger=0)
 
         for socket in self.req_sockets.values():
-            socket.close()
+            socket.close(linger=0)
         self.req_sockets.clear()
-
-        # Terminate context
-        self.context.term()
+        self._req_locks.clear()
 
         logger.info("ZMQ Service '%s' stopped", self.service_name)
 
@@ -131,24 +158,24 @@ class ZMQService:
         logger.debug("Registered handler for method '%s'", method_name)
         return self
 
+    def _encode_event(self, event_type: str, data: Dict[str, Any]) -> List[bytes]:
+        """Encode an event as multipart frames: [topic, json payload]"""
+        message = {
+            "event_type": event_type,
+            "data": data,
+            "source_service": self.service_name,
+            "timestamp": datetime.now().isoformat(),
+        }
+        return [event_type.encode("utf-8"), _dumps(message)]
+
     async def publish_event(self, event_type: str, data: Dict[str, Any]) -> bool:
         """Publish an event to all subscribers"""
         if not self.pub_socket or not self._running:
             return False
 
         try:
-            message = {
-                "event_type": event_type,
-                "data": data,
-                "source_service": self.service_name,
-                "timestamp": datetime.now().isoformat(),
-            }
-
             # Send as multipart message: [topic, data]
-            await self.pub_socket.send_multipart([
-                event_type.encode("utf-8"),
-                json.dumps(message).encode("utf-8")
-            ])
+            await self.pub_socket.send_multipart(self._encode_event(event_type, data))
 
             logger.debug("Published event '%s' from '%s'", event_type, self.service_name)
             return True
@@ -157,18 +184,43 @@ class ZMQService:
             logger.error("Failed to publish event '%s': %s", event_type, e)
             return False
 
+    async def publish_batch(self, events: Iterable[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        """Publish several events back to back.
+
+        Payloads are serialized up front, then handed to the PUB socket with
+        copy=False so pyzmq does not duplicate the encoded buffers. Returns one
+        flag per event, in order, telling whether that event was sent.
+        """
+        events = list(events)
+        if not self.pub_socket or not self._running:
+            return [False] * len(events)
+
+        encoded: List[Optional[List[bytes]]] = []
+        for event_type, data in events:
+            try:
+                encoded.append(self._encode_event(event_type, data))
+            except Exception as e:
+                logger.error("Failed to encode event '%s': %s", event_type, e)
+                encoded.append(None)
+
+        sent = []
+        for (event_type, _), frames in zip(events, encoded):
+            if frames is None:
+                sent.append(False)
+                continue
+            try:
+                await self.pub_socket.send_multipart(frames, copy=False)
+                sent.append(True)
+            except Exception as e:
+                logger.error("Failed to publish event '%s': %s", event_type, e)
+                sent.append(False)
+
+        logger.debug("Published %d/%d batched events from '%s'", sum(sent), len(sent), self.service_name)
+        return sent
+
     async def call(self, service_name: str, method: str, timeout: Optional[float] = None, **kwargs) -> Any:
         """Call a method on another service"""
         try:
-            # Get or create REQ socket for this service
-            if service_name not in self.req_sockets:
-                service_port = self._get_service_rpc_port(service_name)
-                req_socket = self.context.socket(zmq.REQ)
-                req_socket.connect(f"tcp://127.0.0.1:{service_port}")
-                self.req_sockets[service_name] = req_socket
-
-            req_socket = self.req_sockets[service_name]
-
             # Create request
             request_data = {
                 "method": method,
@@ -178,13 +230,22 @@ class ZMQService:
                 "timestamp": datetime.now().isoformat(),
             }
 
-            # Send request and wait for response
-            await req_socket.send_json(request_data)
+            # The REQ socket is kept open across calls; REQ allows only one
+            # outstanding request, so calls to the same service take turns
+            lock = self._req_locks.setdefault(service_name, asyncio.Lock())
+            async with lock:
+                req_socket = self._get_req_socket(service_name)
+                try:
+                    await req_socket.send(_dumps(request_data))
 
-            if timeout is not None:
-                response_data = await asyncio.wait_for(req_socket.recv_json(), timeout=timeout)
-            else:
-                response_data = await req_socket.recv_json()
+                    if timeout is not None:
+                        response_data = _loads(await asyncio.wait_for(req_socket.recv(), timeout=timeout))
+                    else:
+                        response_data = _loads(await req_socket.recv())
+                except BaseException:
+                    # A REQ socket stuck mid-request cannot be reused; reconnect next call
+                    self._drop_req_socket(service_name)
+                    raise
 
             if response_data.get("error"):
                 raise RuntimeError(f"Remote service error: {response_data['error']}")
@@ -195,13 +256,28 @@ class ZMQService:
             logger.error("Failed to call %s.%s: %s", service_name, method, e)
             raise
 
+    def _get_req_socket(self, service_name: str):
+        """Return the cached REQ socket for a service, connecting it on first use."""
+        req_socket = self.req_sockets.get(service_name)
+        if req_socket is None:
+            service_port = self._get_service_rpc_port(service_name)
+            req_socket = self.context.socket(zmq.REQ)
+            req_socket.connect(f"tcp://127.0.0.1:{service_port}")
+            self.req_sockets[service_name] = req_socket
+        return req_socket
+
+    def _drop_req_socket(self, service_name: str) -> None:
+        req_socket = self.req_sockets.pop(service_name, None)
+        if req_socket is not None:
+            req_socket.close(linger=0)
+
     def _get_service_rpc_port(self, service_name: str) -> int:
         """Get the RPC port for a service"""
         service_hash = zlib.crc32(service_name.encode("utf-8")) % 1000
         return self.base_port + service_hash
 
     async def _handle_rpc_calls(self):
-        """Background task to handle incoming RPC calls"""
+        """Background task receiving RPC calls; each call is handled in its own task"""
         logger.info("Starting RPC handler for service '%s'", self.service_name)
 
         while self._running:
@@ -210,62 +286,72 @@ class ZMQService:
                     await asyncio.sleep(0.1)
                     continue
 
-                # Receive request with timeout
-                try:
-                    request_data = await asyncio.wait_for(
-                        self.rpc_socket.recv_json(zmq.NOBLOCK), timeout=0.1
-                    )
-                except (asyncio.TimeoutError, zmq.Again):
-                    await asyncio.sleep(0.01)
-                    continue
-
-                method = request_data.get("method")
-                params = request_data.get("params", {})
-                request_id = request_data.get("request_id")
-
-                logger.debug("Received RPC call: %s", method)
-
-                # Handle the request
-                if method in self._handlers:
-                    try:
-                        # Call handler
-                        if asyncio.iscoroutinefunction(self._handlers[method]):
-                            result = await self._handlers[method](**params)
-                        else:
-                            result = self._handlers[method](**params)
-
-                        # Send response
-                        response = {
-                            "request_id": request_id,
-                            "result": result,
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                        await self.rpc_socket.send_json(response)
-
-                    except Exception as e:
-                        logger.error("Handler error for %s: %s", method, e)
-                        # Send error response
-                        response = {
-                            "request_id": request_id,
-                            "error": str(e),
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                        await self.rpc_socket.send_json(response)
-                else:
-                    # Method not found
-                    response = {
-                        "request_id": request_id,
-                        "error": f"Method '{method}' not found",
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                    await self.rpc_socket.send_json(response)
-
+                # ROUTER frames: [routing envelope..., payload]
+                frames = await self.rpc_socket.recv_multipart()
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error("RPC handler error: %s", e)
                 await asyncio.sleep(0.1)
+                continue
+
+            # Bound the number of calls in flight
+            await self._rpc_slots.acquire()
+            task = asyncio.create_task(self._handle_rpc_call(frames[:-1], frames[-1]))
+            self._rpc_tasks.add(task)
+            task.add_done_callback(self._rpc_call_done)
 
         logger.info("RPC handler stopped for service '%s'", self.service_name)
 
+    def _rpc_call_done(self, task: asyncio.Task) -> None:
+        self._rpc_tasks.discard(task)
+        self._rpc_slots.release()
+
+    async def _handle_rpc_call(self, envelope: List[bytes], payload: bytes) -> None:
+        """Run one RPC call and send its response back through the ROUTER socket"""
+        request_id = None
+        try:
+            request_data = _loads(payload)
+            method = request_data.get("method")
+            params = request_data.get("params", {})
+            request_id = request_data.get("request_id")
+
+            logger.debug("Received RPC call: %s", method)
+
+            if method in self._handlers:
+                # Call handler
+                if asyncio.iscoroutinefunction(self._handlers[method]):
+                    result = await self._handlers[method](**params)
+                else:
+                    result = self._handlers[method](**params)
+                response = {
+                    "request_id": request_id,
+                    "result": result,
+                    "timestamp": datetime.now().isoformat(),
+                }
+            else:
+                # Method not found
+                response = {
+                    "request_id": request_id,
+                    "error": f"Method '{method}' not found",
+                    "timestamp": datetime.now().isoformat(),
+                }
+            body = _dumps(response)
+        except Exception as e:
+            logger.error("Handler error for RPC call: %s", e)
+            body = _dumps(
+                {
+                    "request_id": request_id,
+                    "error": str(e),
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
+
+        try:
+            await self.rpc_socket.send_multipart([*envelope, body])
+        except Exception as e:
+            logger.error("Failed to send RPC response: %s", e)
+
     def is_running(self) -> bool:
         """Check if the service is running"""
         return self._running
\ No newline at end of file
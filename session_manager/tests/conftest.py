@@ -3,24 +3,97 @@ Test configuration and fixtures for audio processing service tests.
 """
 
 import asyncio
+import os
+import uuid
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 import pytest_asyncio
 
+try:
+    import uvloop
+except ImportError:  # optional; the default asyncio loop is used instead
+    uvloop = None
+
+from ..infrastructure import storage
 from ..managers.plugin_manager import PluginManager
 from ..managers.session_manager import SessionManager
 
 # Configure pytest-asyncio
 pytest_plugins = ("pytest_asyncio",)
 
+# Port range reserved per xdist worker: ZMQService uses base..base+2999
+XDIST_PORT_STRIDE = 3000
+
+
+def pytest_configure(config):
+    """Give each pytest-xdist worker its own ZeroMQ port range."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if worker.startswith("gw") and "ZMQ_BASE_PORT" not in os.environ:
+        os.environ["ZMQ_BASE_PORT"] = str(5555 + int(worker[2:]) * XDIST_PORT_STRIDE)
+
+
+# The loop-factory hook only exists in newer pytest-asyncio releases
+if uvloop is not None and hasattr(pytest_asyncio.plugin, "PytestAsyncioSpecs"):
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def session_service():
+    """One running SessionManagerService shared by the tests of a module.
+
+    Starting the service binds ZeroMQ sockets, connects to the bridge and scans
+    plugins, so it is done once per module rather than once per test. It is shut
+    down at the end of the module so that modules starting their own service can
+    bind the same ports.
+    """
+    from ..main import SessionManagerService
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SESSION_MANAGER_AUTO_CREATE_DEFAULT", "0")
+        service = SessionManagerService()
+        await service.startup()
+    await asyncio.wait_for(service.ready_event.wait(), timeout=5.0)
+    yield service
+    await service.shutdown()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def bus_client(session_service):
+    """One started servicebus client per module, for tests that only call() the service.
+
+    It lives exactly as long as the module's session_service. Its unique name
+    keeps it from colliding with clients that other modules start themselves.
+    """
+    Service = pytest.importorskip("servicebus").Service
+
+    client = Service(f"test_client_{uuid.uuid4().hex[:8]}")
+    await client.start()
+    yield client
+    await client.stop()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def reset_session(session_service):
+    """Drop the current pedalboard and connections before each test."""
+    session_manager = session_service.session_manager
+    session_manager.pedalboard_service.clear()
+    session_manager.connection_service.clear_connections()
+    session_manager._invalidate_status()
+    yield session_service
+
 
 @pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def storage_dir(tmp_path, monkeypatch):
+    """Point pedalboard storage at a per-test data directory."""
+    data_dir = tmp_path / "sm_data"
+    monkeypatch.setenv("SESSION_MANAGER_DATA_DIR", os.fspath(data_dir))
+    storage._reset_data_dir_cache()
+    yield data_dir
+    storage._reset_data_dir_cache()
 
 
 @pytest.fixture
@@ -28,6 +101,7 @@ def mock_servicebus():
     """Mock servicebus for testing."""
     mock = Mock()
     mock.publish_event = AsyncMock()
+    mock.publish_batch = AsyncMock(side_effect=lambda events: [True] * len(events))
     mock.call = AsyncMock()
     return mock
 
@@ -116,6 +190,34 @@ async def plugin_manager(mock_servicebus, mock_bridge_client):
     return manager
 
 
+@pytest.fixture
+def sample_plugin_uri(plugin_manager):
+    """URI of the first plugin the mock bridge reports as available."""
+    return next(iter(plugin_manager.available_plugins))
+
+
+@pytest_asyncio.fixture
+async def loaded_instance(plugin_manager, sample_plugin_uri):
+    """Load the sample plugin and yield its instance_id."""
+    load_result = await plugin_manager.load_plugin(sample_plugin_uri, 100, 200)
+    instance_id = load_result["instance_id"]
+    yield instance_id
+    try:
+        await plugin_manager.unload_plugin(instance_id)
+    except ValueError:
+        # Already unloaded by the test
+        pass
+
+
+@pytest_asyncio.fixture(params=[2])
+async def loaded_instances(request, plugin_manager, sample_plugin_uri):
+    """Load the sample plugin request.param times and return the instance_ids."""
+    results = await plugin_manager.load_plugins(
+        [(sample_plugin_uri, 100 + i * 200, 200 + i * 200) for i in range(request.param)]
+    )
+    return [result["instance_id"] for result in results]
+
+
 @pytest.fixture
 def session_manager(mock_servicebus, plugin_manager, mock_bridge_client):
     """Create SessionManager instance for testing."""
@@ -0,0 +1,57 @@
+"""Async helpers shared by the ZeroMQ and real-bridge integration tests."""
+import asyncio
+
+
+async def wait_until_ready(coro_factory, timeout=2.0, interval=0.005):
+    """Retry ``coro_factory()`` until it succeeds; return its result.
+
+    Used in place of fixed sleeps after binding sockets, e.g.
+    ``await wait_until_ready(lambda: client.call("session_manager", "health"))``.
+    """
+
+    async def attempt():
+        while True:
+            try:
+                return await asyncio.wait_for(coro_factory(), timeout=max(interval, 0.1))
+            except Exception:
+                await asyncio.sleep(interval)
+
+    return await asyncio.wait_for(attempt(), timeout=timeout)
+
+
+async def wait_subscribed(publish, sub, timeout=2.0, interval=0.01):
+    """Publish a probe event until subscriber ``sub`` receives it.
+
+    ``publish`` is called with the probe event type and must return an
+    awaitable that sends it, e.g. ``lambda t: publisher.publish_event(t, {})``.
+    """
+    received = asyncio.Event()
+
+    async def on_probe(event):
+        received.set()
+
+    sub.register_event_handler("__ready__", on_probe)
+
+    async def ping():
+        while not received.is_set():
+            await publish("__ready__")
+            try:
+                await asyncio.wait_for(received.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    await asyncio.wait_for(ping(), timeout=timeout)
+
+
+async def run_command(*argv, timeout=5):
+    """Run a command without blocking the event loop; return (returncode, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, out.decode(), err.decode()
@@ -26,6 +26,18 @@ logger = logging.getLogger("pedalboard_demo")
 
 
 
+async def connect_ports(bridge, src, tgt):
+    """Connect two JACK ports through the bridge and log the outcome."""
+    try:
+        res = await bridge.call("modhost_bridge", "connect_jack_ports", port1=src, port2=tgt)
+        if res.get("success"):
+            logger.info("Connected %s -> %s", src, tgt)
+        else:
+            logger.error("Failed to connect %s -> %s: %s", src, tgt, res.get("error"))
+    except Exception as e:
+        logger.error("Exception while connecting %s -> %s: %s", src, tgt, e)
+
+
 async def run_real_demo():
 
     bridge = BridgeClient()
@@ -44,20 +56,28 @@ async def run_real_demo():
         logger.error("No suitable plugins selected to load.")
     else:
         logger.info("Loading %d plugin(s):", len(chosen_uris))'''
+    # Load all plugins concurrently; results come back in chosen_uris order
+    results = await asyncio.gather(
+        *(
+            plugin_manager.load_plugin(uri, x=idx * 180, y=100 + (idx % 2) * 120)
+            for idx, uri in enumerate(chosen_uris)
+        ),
+        return_exceptions=True,
+    )
     loaded_instances = []
-    for idx, uri in enumerate(chosen_uris):
-        try:
-            load_res = await plugin_manager.load_plugin(uri, x=idx * 180, y=100 + (idx % 2) * 120)
-            loaded_instances.append(load_res["instance_id"])
-            logger.info("  Loaded %s -> %s", uri, load_res["instance_id"])
-        except Exception as e:
-            logger.error("  Failed to load %s: %s", uri, e)
+    for uri, load_res in zip(chosen_uris, results):
+        if isinstance(load_res, Exception):
+            logger.error("  Failed to load %s: %s", uri, load_res)
+            continue
+        loaded_instances.append(load_res["instance_id"])
+        logger.info("  Loaded %s -> %s", uri, load_res["instance_id"])
 
     # Setup system I/O routing if at least one plugin
     if loaded_instances:
         # Explicitly connect one system capture to the first plugin input and
         # the first plugin output to the first system playback so demo wires
         # a real signal path: capture -> effect -> playback
+        system_inputs, system_outputs = [], []
         pb = session_manager.pedalboard_service.current_pedalboard
         if not pb:
             logger.error("No current pedalboard found; skipping I/O wiring")
@@ -66,33 +86,18 @@ async def run_real_demo():
             system_outputs = pb.get_system_outputs()
         first_instance = loaded_instances[0]
 
-        # Connect capture_1 -> plugin:in_1
-        try:
-            if not system_inputs:
-                raise RuntimeError("no system inputs discovered")
-            src = system_inputs[0]
-            tgt = f"{first_instance}:in_1"
-            res = await bridge.call("modhost_bridge", "connect_jack_ports", port1=src, port2=tgt)
-            if res.get("success"):
-                logger.info("Connected %s -> %s", src, tgt)
-            else:
-                logger.error("Failed to connect %s -> %s: %s", src, tgt, res.get("error"))
-        except Exception as e:
-            logger.error("Exception while connecting input: %s", e)
-
-        # Connect plugin:out_1 -> playback_1
-        try:
-            if not system_outputs:
-                raise RuntimeError("no system outputs discovered")
-            src = f"{first_instance}:out_1"
-            tgt = system_outputs[0]
-            res = await bridge.call("modhost_bridge", "connect_jack_ports", port1=src, port2=tgt)
-            if res.get("success"):
-                logger.info("Connected %s -> %s", src, tgt)
-            else:
-                logger.error("Failed to connect %s -> %s: %s", src, tgt, res.get("error"))
-        except Exception as e:
-            logger.error("Exception while connecting output: %s", e)
+        # capture_1 -> plugin:in_1 and plugin:out_1 -> playback_1 touch
+        # disjoint ports, so issue both connects together
+        links = []
+        if system_inputs:
+            links.append((system_inputs[0], f"{first_instance}:in_1"))
+        else:
+            logger.error("Cannot connect input: no system inputs discovered")
+        if system_outputs:
+            links.append((f"{first_instance}:out_1", system_outputs[0]))
+        else:
+            logger.error("Cannot connect output: no system outputs discovered")
+        await asyncio.gather(*(connect_ports(bridge, src, tgt) for src, tgt in links))
 
     # Optionally persist
     '''if not args.no_save:
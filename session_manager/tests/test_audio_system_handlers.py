@@ -52,7 +52,6 @@ class TestAudioSystemHandlers:
             mock_service_bus,
         )
 
-    @pytest.mark.asyncio
     async def test_init_jack_success(self, handlers, mock_bridge_client):
         """Test successful JACK initialization"""
         # Setup mock response
@@ -65,7 +64,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "init_jack")
 
-    @pytest.mark.asyncio
     async def test_init_jack_failure(self, handlers, mock_bridge_client):
         """Test JACK initialization failure"""
         # Setup mock to raise exception
@@ -77,7 +75,6 @@ class TestAudioSystemHandlers:
         # Verify
         assert result == {"success": False, "error": "JACK init failed"}
 
-    @pytest.mark.asyncio
     async def test_get_jack_data_success(self, handlers, mock_bridge_client):
         """Test successful JACK data retrieval"""
         # Setup mock response
@@ -105,7 +102,6 @@ class TestAudioSystemHandlers:
         assert result == expected
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "get_jack_data", with_transport=True)
 
-    @pytest.mark.asyncio
     async def test_get_jack_buffer_size_success(self, handlers, mock_bridge_client):
         """Test successful buffer size retrieval"""
         # Setup mock response
@@ -121,7 +117,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True, "buffer_size": 1024}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "get_jack_buffer_size")
 
-    @pytest.mark.asyncio
     async def test_set_jack_buffer_size_success(self, handlers, mock_bridge_client):
         """Test successful buffer size setting"""
         # Setup mock response
@@ -137,7 +132,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True, "buffer_size": 512}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "set_jack_buffer_size", size=512)
 
-    @pytest.mark.asyncio
     async def test_set_jack_buffer_size_missing_param(self, handlers, mock_bridge_client):
         """Test buffer size setting with missing parameter"""
         # Call handler without size parameter
@@ -147,7 +141,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": False, "error": "Missing 'size' parameter"}
         mock_bridge_client.call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_get_jack_port_alias_success(self, handlers, mock_bridge_client):
         """Test successful port alias retrieval"""
         # Setup mock response
@@ -163,7 +156,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True, "alias": "system:capture_1"}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "get_jack_port_alias", port_name="system:capture_1")
 
-    @pytest.mark.asyncio
     async def test_get_jack_port_alias_missing_param(self, handlers, mock_bridge_client):
         """Test port alias retrieval with missing parameter"""
         # Call handler without port_name parameter
@@ -173,7 +165,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": False, "error": "Missing 'port_name' parameter"}
         mock_bridge_client.call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_get_jack_hardware_ports_success(self, handlers, mock_bridge_client):
         """Test successful hardware ports retrieval"""
         # Setup mock response
@@ -189,7 +180,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True, "ports": ["system:capture_1", "system:capture_2"]}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "get_jack_hardware_ports", is_audio=True, is_output=False)
 
-    @pytest.mark.asyncio
     async def test_has_midi_beat_clock_sender_port_success(self, handlers, mock_bridge_client):
         """Test successful MIDI beat clock sender port check"""
         # Setup mock response
@@ -205,7 +195,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True, "has_port": True}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "has_midi_beat_clock_sender_port")
 
-    @pytest.mark.asyncio
     async def test_connect_jack_ports_success(self, handlers, mock_bridge_client):
         """Test successful JACK port connection"""
         # Setup mock response
@@ -219,7 +208,6 @@ class TestAudioSystemHandlers:
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "connect_jack_ports",
                                                        port1="system:capture_1", port2="effect:input")
 
-    @pytest.mark.asyncio
     async def test_connect_jack_ports_missing_params(self, handlers, mock_bridge_client):
         """Test JACK port connection with missing parameters"""
         # Call handler with missing parameters
@@ -229,7 +217,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": False, "error": "Missing 'port1' or 'port2' parameter"}
         mock_bridge_client.call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_disconnect_jack_ports_success(self, handlers, mock_bridge_client):
         """Test successful JACK port disconnection"""
         # Setup mock response
@@ -243,7 +230,6 @@ class TestAudioSystemHandlers:
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "disconnect_jack_ports",
                                                        port1="system:capture_1", port2="effect:input")
 
-    @pytest.mark.asyncio
     async def test_disconnect_all_jack_ports_success(self, handlers, mock_bridge_client):
         """Test successful disconnect all ports"""
         # Setup mock response
@@ -256,7 +242,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "disconnect_all_jack_ports", port="system:capture_1")
 
-    @pytest.mark.asyncio
     async def test_disconnect_all_jack_ports_missing_param(self, handlers, mock_bridge_client):
         """Test disconnect all ports with missing parameter"""
         # Call handler without port parameter
@@ -266,7 +251,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": False, "error": "Missing 'port' parameter"}
         mock_bridge_client.call.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_reset_xruns_success(self, handlers, mock_bridge_client):
         """Test successful xruns reset"""
         # Setup mock response
@@ -279,7 +263,6 @@ class TestAudioSystemHandlers:
         assert result == {"success": True}
         mock_bridge_client.call.assert_called_once_with("modhost_bridge", "reset_xruns")
 
-    @pytest.mark.asyncio
     async def test_service_bus_method_registration(self, handlers, mock_service_bus):
         """Test that all audio system methods are registered with ServiceBus"""
         # Call register method
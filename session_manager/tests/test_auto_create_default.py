@@ -13,19 +13,20 @@ if os.environ.get("USE_REAL_BRIDGE", "0") != "1":
     pytest.skip("Integration test: set USE_REAL_BRIDGE=1 to run against a real bridge", allow_module_level=True)
 
 
-@pytest.mark.asyncio
-async def test_auto_create_default_pedalboard():
-    # Ensure the env var is present so session-manager will auto-create
-    os.environ["SESSION_MANAGER_AUTO_CREATE_DEFAULT"] = "1"
+async def test_auto_create_default_pedalboard(monkeypatch):
+    # Ensure the env var is present so session-manager will auto-create.
+    # This exercises startup itself, so it starts its own service instead of
+    # using the session_service fixture, which always disables the flag.
+    monkeypatch.setenv("SESSION_MANAGER_AUTO_CREATE_DEFAULT", "1")
 
     # Create and start the service (will use the real BridgeClient)
     service = SessionManagerService()
     await service.startup()
 
-    # Give some time for the create_pedalboard task to run
-    await asyncio.sleep(0.5)
-
     try:
+        # Wait for the background create_pedalboard task to finish
+        await asyncio.wait_for(service.default_pedalboard_created.wait(), timeout=5.0)
+
         assert service.session_manager is not None
         pb = getattr(service.session_manager, "current_pedalboard", None)
         assert pb is not None, "Expected a default pedalboard to be created"
@@ -1,10 +1,10 @@
 import asyncio
 import os
-import subprocess
 
 import pytest
 
 from ..main import SessionManagerService
+from .helpers import run_command
 
 
 # Run against a real bridge only
@@ -12,18 +12,17 @@ if os.environ.get("USE_REAL_BRIDGE", "0") != "1":
     pytest.skip("Integration test: set USE_REAL_BRIDGE=1 to run against a real bridge", allow_module_level=True)
 
 
-@pytest.mark.asyncio
-async def test_complete_pedalboard_workflow():
+async def test_complete_pedalboard_workflow(monkeypatch):
     """
     Complete real-world test: Create pedalboard, set up audio routing, verify with PipeWire
     """
-    os.environ["SESSION_MANAGER_AUTO_CREATE_DEFAULT"] = "0"
+    monkeypatch.setenv("SESSION_MANAGER_AUTO_CREATE_DEFAULT", "0")
 
     print("\n=== Starting Complete Pedalboard Workflow Test ===")
 
     service = SessionManagerService()
     await service.startup()
-    await asyncio.sleep(1.5)  # Give more time for plugin scanning
+    await asyncio.wait_for(service.ready_event.wait(), timeout=5.0)
 
     try:
         # 1. Check initial system state
@@ -63,9 +62,9 @@ async def test_complete_pedalboard_workflow():
         # Show current PipeWire state
         print("   Current PipeWire connections:")
         try:
-            result = subprocess.run(["pw-link", "-l"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
+            returncode, output, _ = await run_command("pw-link", "-l")
+            if returncode == 0:
+                lines = output.strip().split('\n')
                 for line in lines[:10]:  # Show first 10 lines
                     print(f"     {line}")
                 if len(lines) > 10:
@@ -84,24 +83,20 @@ async def test_complete_pedalboard_workflow():
             source = "alsa_input.pci-0000_00_1f.3.analog-stereo:capture_FL"
             target = "mod-monitor:in_1"
 
-            result = subprocess.run(
-                ["pw-link", source, target],
-                capture_output=True, text=True, timeout=5
-            )
+            returncode, _, stderr = await run_command("pw-link", source, target)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 test_connections.append((source, target))
                 print(f"   ✓ Connected: {source} -> {target}")
 
-                # Verify connection exists
-                await asyncio.sleep(0.2)
-                verify_result = subprocess.run(["pw-link", "-l"], capture_output=True, text=True)
-                if verify_result.returncode == 0 and source in verify_result.stdout and target in verify_result.stdout:
+                # pw-link returns once the link exists, so verify straight away
+                verify_code, verify_out, _ = await run_command("pw-link", "-l")
+                if verify_code == 0 and source in verify_out and target in verify_out:
                     print("   ✓ Connection verified in PipeWire")
                 else:
                     print("   ⚠ Connection not found in PipeWire output")
             else:
-                print(f"   ⚠ Failed to create connection: {result.stderr}")
+                print(f"   ⚠ Failed to create connection: {stderr}")
 
         except Exception as e:
             print(f"   Error creating test connection: {e}")
@@ -129,13 +124,15 @@ async def test_complete_pedalboard_workflow():
 
         # Cleanup test connections
         print("\n7. Cleaning up test connections...")
-        for source, target in test_connections:
-            try:
-                subprocess.run(["pw-link", "-d", source, target],
-                             capture_output=True, timeout=5)
+        results = await asyncio.gather(
+            *(run_command("pw-link", "-d", source, target) for source, target in test_connections),
+            return_exceptions=True,
+        )
+        for (source, target), result in zip(test_connections, results):
+            if isinstance(result, Exception):
+                print(f"   Warning cleaning up {source} -> {target}: {result}")
+            else:
                 print(f"   ✓ Removed: {source} -> {target}")
-            except Exception as e:
-                print(f"   Warning cleaning up {source} -> {target}: {e}")
 
         print("\n=== Test completed successfully ===")
 
@@ -147,5 +144,6 @@ if __name__ == "__main__":
     # Allow running this test directly
     import sys
     if len(sys.argv) > 1 and sys.argv[1] == "direct":
-        os.environ["USE_REAL_BRIDGE"] = "1"
-        asyncio.run(test_complete_pedalboard_workflow())
\ No newline at end of file
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("USE_REAL_BRIDGE", "1")
+            asyncio.run(test_complete_pedalboard_workflow(mp))
\ No newline at end of file
@@ -1,12 +1,13 @@
 """Tests for ConnectionService."""
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 from ..services.connection_service import ConnectionService
 from ..models.connection import Connection
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_bridge_client():
     """Mock bridge client for testing."""
     mock = AsyncMock()
@@ -14,7 +15,7 @@ def mock_bridge_client():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_pedalboard_service():
     """Mock pedalboard service for testing."""
     service = MagicMock()
@@ -22,13 +23,13 @@ def mock_pedalboard_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_service_bus():
     """Mock service bus for testing."""
     return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_plugin_manager():
     """Mock plugin manager for testing."""
     mock = Mock()
@@ -36,13 +37,27 @@ def mock_plugin_manager():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def connection_service(mock_bridge_client, mock_pedalboard_service, mock_plugin_manager, mock_service_bus):
     """Create ConnectionService instance for testing."""
     return ConnectionService(mock_bridge_client, mock_pedalboard_service, mock_plugin_manager, mock_service_bus)
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture(autouse=True)
+async def _reset(mock_bridge_client, mock_pedalboard_service, mock_service_bus, connection_service):
+    """Reset the shared mocks and service between tests."""
+    mock_bridge_client.reset_mock()
+    mock_bridge_client.call.return_value = {"success": True}
+    mock_bridge_client.call.side_effect = None
+    mock_pedalboard_service.reset_mock()
+    mock_pedalboard_service.current_pedalboard = None
+    mock_service_bus.reset_mock()
+    connection_service.clear_connections()
+    yield
+    # Let publish tasks finish on this test's event loop
+    await connection_service.close()
+
+
 async def test_create_connection_success(connection_service, mock_bridge_client, mock_service_bus):
     """Test successful connection creation."""
     # Setup
@@ -50,6 +65,7 @@ async def test_create_connection_success(connection_service, mock_bridge_client,
 
     # Execute
     result = await connection_service.create_connection("plugin1", "out", "plugin2", "in")
+    await connection_service.close()
 
     # Verify
     assert result["connection_id"] is not None
@@ -59,10 +75,9 @@ async def test_create_connection_success(connection_service, mock_bridge_client,
     assert result["connection"]["target_port"] == "in"
 
     mock_bridge_client.call.assert_called_with("modhost_bridge", "create_connection", source_plugin="plugin1", source_port="out", target_plugin="plugin2", target_port="in")
-    mock_service_bus.publish_event.assert_called_once()
+    mock_service_bus.publish_event.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_create_connection_failure(connection_service, mock_bridge_client):
     """Test connection creation failure."""
     # Setup
@@ -73,7 +88,6 @@ async def test_create_connection_failure(connection_service, mock_bridge_client)
         await connection_service.create_connection("plugin1", "out", "plugin2", "in")
 
 
-@pytest.mark.asyncio
 async def test_remove_connection_success(connection_service, mock_bridge_client, mock_service_bus):
     """Test successful connection removal."""
     # Setup
@@ -83,6 +97,7 @@ async def test_remove_connection_success(connection_service, mock_bridge_client,
 
     # Execute
     result = await connection_service.remove_connection(connection.connection_id)
+    await connection_service.close()
 
     # Verify
     assert result["status"] == "ok"
@@ -90,16 +105,30 @@ async def test_remove_connection_success(connection_service, mock_bridge_client,
     assert len(connection_service.connections) == 0
 
     mock_bridge_client.call.assert_called_with("modhost_bridge", "remove_connection", connection_id=connection.connection_id)
-    mock_service_bus.publish_event.assert_called_once()
+    mock_service_bus.publish_event.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_remove_connection_not_found(connection_service):
     """Test removing non-existent connection."""
     with pytest.raises(ValueError, match="Connection not found"):
         await connection_service.remove_connection("nonexistent")
 
 
+async def test_remove_connection_keeps_order(connection_service):
+    """Test removing one connection by id leaves the others in insertion order."""
+    # Setup
+    conns = [Connection(f"p{i}", "out", f"p{i + 1}", "in") for i in range(3)]
+    for conn in conns:
+        connection_service.connections.append(conn)
+
+    # Execute
+    await connection_service.remove_connection(conns[1].connection_id)
+
+    # Verify
+    assert connection_service.get_connections() == [conns[0], conns[2]]
+    assert connection_service.connections.find(conns[1].connection_id) is None
+
+
 def test_get_connections(connection_service):
     """Test getting all connections."""
     # Setup
@@ -127,4 +156,11 @@ def test_clear_connections(connection_service):
     connection_service.clear_connections()
 
     # Verify
-    assert len(connection_service.connections) == 0
\ No newline at end of file
+    assert len(connection_service.connections) == 0
+
+
+async def test_create_connection_unknown_plugin(connection_service, mock_bridge_client):
+    """Test that unknown plugins are rejected on the public path."""
+    with pytest.raises(ValueError, match="Source plugin not found"):
+        await connection_service.create_connection("missing", "out", "plugin2", "in")
+    mock_bridge_client.call.assert_not_called()
@@ -1,24 +1,22 @@
 import asyncio
-import os
 import uuid
 
 import pytest
-from servicebus import Service
 
 from ..main import SessionManagerService
+from .helpers import wait_subscribed
 
-# Ensure mod-host runs in simulate mode for tests
-os.environ["SIMULATE_MODHOST"] = "true"
+Service = pytest.importorskip("servicebus").Service
 
 
-@pytest.mark.asyncio
-async def test_load_plugin_rpc_and_event():
+async def test_load_plugin_rpc_and_event(monkeypatch):
+    # Ensure mod-host runs in simulate mode for tests
+    monkeypatch.setenv("SIMULATE_MODHOST", "true")
+
     # Start the session_manager service in-process
     service = SessionManagerService()
     await service.startup()
-
-    # Give ZeroMQ sockets a moment to bind
-    await asyncio.sleep(0.15)
+    await asyncio.wait_for(service.ready_event.wait(), timeout=5.0)
 
     client = Service(f"client_{uuid.uuid4().hex[:8]}")
     await client.start()
@@ -27,9 +25,6 @@ async def test_load_plugin_rpc_and_event():
     sub = Service(f"sub_{uuid.uuid4().hex[:8]}")
     await sub.start()
 
-    # Ensure subscription is ready
-    await asyncio.sleep(0.05)
-
     got = asyncio.Event()
     payload = {}
 
@@ -40,13 +35,17 @@ async def test_load_plugin_rpc_and_event():
 
     sub.register_event_handler("plugin_loaded", on_plugin_loaded)
 
-    # Give subscription a moment
-    await asyncio.sleep(0.05)
+    # Ensure the subscription is live before triggering the event
+    await wait_subscribed(lambda t: service.zmq_service.publish_event(t, {}), sub)
 
     # Call load_plugin RPC (use one available plugin URI)
     plugins = await client.call("session_manager", "get_available_plugins")
     # get_available_plugins returns dict of plugins
-    test_uri = list(plugins.keys())[0]
+    if not plugins:
+        await asyncio.gather(client.stop(), sub.stop())
+        await service.shutdown()
+        pytest.skip("no plugins available")
+    test_uri = next(iter(plugins))
 
     # Make RPC to load plugin
     result = await asyncio.wait_for(
@@ -62,7 +61,6 @@ async def test_load_plugin_rpc_and_event():
     assert payload.get("uri") == test_uri
     assert payload.get("instance_id") is not None
 
-    # Cleanup
-    await client.stop()
-    await sub.stop()
+    # Cleanup: the two bus clients are independent, stop them together
+    await asyncio.gather(client.stop(), sub.stop())
     await service.shutdown()
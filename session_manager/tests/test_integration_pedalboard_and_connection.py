@@ -1,27 +1,26 @@
 import asyncio
-import os
 import uuid
 
 import pytest
-from servicebus import Service
 
 from ..main import SessionManagerService
+from .helpers import wait_until_ready
 
+Service = pytest.importorskip("servicebus").Service
 
-@pytest.mark.asyncio
-async def test_pedalboard_create_save_load_and_connection(tmp_path):
+
+async def test_pedalboard_create_save_load_and_connection(tmp_path, monkeypatch):
     # Ensure modhost runs in simulate mode for tests
-    os.environ["SIMULATE_MODHOST"] = "true"
+    monkeypatch.setenv("SIMULATE_MODHOST", "true")
 
     # Start the audio processing service
     service = SessionManagerService()
     await service.startup()
 
-    # give the service time to bind sockets
-    await asyncio.sleep(0.1)
-
     client = Service(f"client_{uuid.uuid4().hex[:8]}")
     await client.start()
+    # Poll until the service answers instead of sleeping for socket binds
+    await wait_until_ready(lambda: client.call("session_manager", "health"))
 
     try:
         # Create a pedalboard
@@ -42,7 +41,7 @@ async def test_pedalboard_create_save_load_and_connection(tmp_path):
         # Load a plugin if available
         avail = await client.call("session_manager", "get_available_plugins")
         if avail and isinstance(avail, dict) and len(list(avail.keys())) > 0:
-            test_uri = list(avail.keys())[0]
+            test_uri = next(iter(avail))
             load_res = await client.call(
                 "session_manager", "load_plugin", uri=test_uri
             )
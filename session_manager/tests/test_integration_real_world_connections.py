@@ -1,10 +1,9 @@
 import asyncio
 import os
-import subprocess
 
 import pytest
 
-from ..main import SessionManagerService
+from .helpers import run_command
 
 
 # Run against a real bridge only
@@ -12,62 +11,60 @@ if os.environ.get("USE_REAL_BRIDGE", "0") != "1":
     pytest.skip("Integration test: set USE_REAL_BRIDGE=1 to run against a real bridge", allow_module_level=True)
 
 
-@pytest.mark.asyncio
-async def test_create_pedalboard_with_system_connections():
+async def _disconnect(source_port, target_port):
+    """Remove one PipeWire link, reporting (not raising) failures."""
+    try:
+        returncode, _, _ = await run_command("pw-link", "-d", source_port, target_port)
+    except Exception as e:
+        print(f"Warning: Could not remove connection {source_port} -> {target_port}: {e}")
+        return
+    if returncode == 0:
+        print(f"✓ Removed connection: {source_port} -> {target_port}")
+    else:
+        print(f"⚠ Could not remove connection: {source_port} -> {target_port}")
+
+
+async def test_create_pedalboard_with_system_connections(session_service, reset_session):
     """
     Real-world test: create a pedalboard with system input/output connections
     and verify they exist using PipeWire commands.
     """
-    os.environ["SESSION_MANAGER_AUTO_CREATE_DEFAULT"] = "0"
-
-    service = SessionManagerService()
-    await service.startup()
-
-    # Give services time to initialize
-    await asyncio.sleep(1.0)
+    # Create a new pedalboard
+    result = await session_service.session_manager.create_pedalboard(
+        "System Passthrough Test",
+        "Test pedalboard with direct input to output connections"
+    )
+    assert result.get("pedalboard_id") is not None
+
+    # Test direct PipeWire connections using pw-link command
+    # Connect audio input to mod-monitor (mod-host's audio interface)
+    pipewire_connections = [
+        ("alsa_input.pci-0000_00_1f.3.analog-stereo:capture_FL", "mod-monitor:in_1"),  # Left
+        ("alsa_input.pci-0000_00_1f.3.analog-stereo:capture_FR", "mod-monitor:in_2"),  # Right
+    ]
+
+    created_connections = []
+
+    # Create connections using pw-link directly (since session-manager expects plugin instances)
+    results = await asyncio.gather(
+        *(run_command("pw-link", s, t) for s, t in pipewire_connections), return_exceptions=True
+    )
+    for (source_port, target_port), result in zip(pipewire_connections, results):
+        if isinstance(result, Exception):
+            print(f"Warning: Could not create connection {source_port} -> {target_port}: {result}")
+        elif result[0] == 0:
+            created_connections.append((source_port, target_port))
+            print(f"✓ Created PipeWire connection: {source_port} -> {target_port}")
+        else:
+            print(f"⚠ Failed to create connection: {source_port} -> {target_port}")
+            print(f"  Error: {result[2]}")
 
     try:
-        # Create a new pedalboard
-        result = await service.session_manager.create_pedalboard(
-            "System Passthrough Test",
-            "Test pedalboard with direct input to output connections"
-        )
-        assert result.get("pedalboard_id") is not None
-
-        # Test direct PipeWire connections using pw-link command
-        # Connect audio input to mod-monitor (mod-host's audio interface)
-        pipewire_connections = [
-            ("alsa_input.pci-0000_00_1f.3.analog-stereo:capture_FL", "mod-monitor:in_1"),  # Left
-            ("alsa_input.pci-0000_00_1f.3.analog-stereo:capture_FR", "mod-monitor:in_2"),  # Right
-        ]
-
-        created_connections = []
-
-        # Create connections using pw-link directly (since session-manager expects plugin instances)
-        for source_port, target_port in pipewire_connections:
-            try:
-                # Use pw-link to create the connection
-                result = subprocess.run(
-                    ["pw-link", source_port, target_port],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-
-                if result.returncode == 0:
-                    created_connections.append((source_port, target_port))
-                    print(f"✓ Created PipeWire connection: {source_port} -> {target_port}")
-                else:
-                    print(f"⚠ Failed to create connection: {source_port} -> {target_port}")
-                    print(f"  Error: {result.stderr}")
-            except Exception as e:
-                print(f"Warning: Could not create connection {source_port} -> {target_port}: {e}")
-
         # Also test session-manager connection creation with mock plugin instances
         # (This tests the session-manager API even if no real plugins are loaded)
         try:
             # This will fail but tests the API path
-            conn_result = await service.session_manager.create_connection(
+            conn_result = await session_service.session_manager.create_connection(
                 source_plugin="nonexistent_plugin",
                 source_port="output_1",
                 target_plugin="another_nonexistent_plugin",
@@ -76,15 +73,9 @@ async def test_create_pedalboard_with_system_connections():
         except Exception as e:
             print(f"Expected failure testing session-manager API: {e}")
 
-        # Give connections time to be established
-        await asyncio.sleep(0.5)
-
+        # pw-link returns once the link exists, so verify straight away
         # Verify connections exist using PipeWire commands
-        verification_passed = await verify_pipewire_connections(pipewire_connections)
-
-        # Also try pw-link for verification if pw-dump fails
-        if not verification_passed:
-            verification_passed = await verify_with_pw_link(pipewire_connections)
+        verification_passed = await verify_with_pw_link(pipewire_connections)
 
         if created_connections:
             print(f"Successfully created {len(created_connections)} connections")
@@ -92,96 +83,51 @@ async def test_create_pedalboard_with_system_connections():
                 print("✓ Connections verified with PipeWire tools")
             else:
                 print("⚠ Could not verify connections with PipeWire tools (may still exist)")
-
-        # Clean up connections using pw-link disconnect
-        for source_port, target_port in created_connections:
-            try:
-                result = subprocess.run(
-                    ["pw-link", "-d", source_port, target_port],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    print(f"✓ Removed connection: {source_port} -> {target_port}")
-                else:
-                    print(f"⚠ Could not remove connection: {source_port} -> {target_port}")
-            except Exception as e:
-                print(f"Warning: Could not remove connection {source_port} -> {target_port}: {e}")
-
     finally:
-        await service.shutdown()
+        # Disconnect concurrently; runs even if verification raised
+        async with asyncio.TaskGroup() as tg:
+            for source_port, target_port in created_connections:
+                tg.create_task(_disconnect(source_port, target_port))
 
 
-async def verify_pipewire_connections(expected_connections):
-    """Verify connections exist using pw-dump command"""
-    try:
-        # Run pw-dump to get current PipeWire state
-        result = subprocess.run(
-            ["pw-dump"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        if result.returncode != 0:
-            print(f"pw-dump failed with return code {result.returncode}")
-            return False
-
-        output = result.stdout
-
-        # Look for connection patterns in the output
-        # pw-dump shows links between nodes/ports
-        connections_found = 0
-        for source_port, target_port in expected_connections:
-            # Simple check - look for both port names in proximity
-            if source_port in output and target_port in output:
-                connections_found += 1
-                print(f"Found potential connection: {source_port} -> {target_port}")
-
-        return connections_found > 0
+def _parse_pw_links(output):
+    """Parse `pw-link -l` output into a set of (source, target) port edges.
 
-    except subprocess.TimeoutExpired:
-        print("pw-dump command timed out")
-        return False
-    except FileNotFoundError:
-        print("pw-dump command not found")
-        return False
-    except Exception as e:
-        print(f"Error running pw-dump: {e}")
-        return False
+    Each port is printed unindented, followed by indented `|-> target` lines
+    for its outgoing links and `|<- source` lines for incoming ones.
+    """
+    edges = set()
+    port = None
+    for line in output.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if not line[0].isspace():
+            port = stripped
+        elif port is not None and stripped.startswith("|->"):
+            edges.add((port, stripped[3:].strip()))
+        elif port is not None and stripped.startswith("|<-"):
+            edges.add((stripped[3:].strip(), port))
+    return edges
 
 
 async def verify_with_pw_link(expected_connections):
-    """Verify connections using pw-link -l command"""
+    """Verify every expected (source, target) link exists using pw-link -l -o"""
     try:
-        # Run pw-link -l to list current connections
-        result = subprocess.run(
-            ["pw-link", "-l"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        if result.returncode != 0:
-            print(f"pw-link -l failed with return code {result.returncode}")
-            return False
-
-        output = result.stdout
+        # List links of output ports once, then check each expected edge
+        returncode, output, _ = await run_command("pw-link", "-l", "-o")
+        if returncode != 0:
+            raise RuntimeError(f"pw-link -l failed with return code {returncode}")
         print("Current PipeWire connections:")
         print(output)
-
-        # pw-link -l shows connections in format "source -> target"
-        connections_found = 0
+        edges = _parse_pw_links(output)
         for source_port, target_port in expected_connections:
-            # Look for the connection in the output
-            if f"{source_port}" in output and f"{target_port}" in output:
-                connections_found += 1
+            if (source_port, target_port) in edges:
                 print(f"✓ Verified connection: {source_port} -> {target_port}")
 
-        return connections_found > 0
+        return all(link in edges for link in expected_connections)
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print("pw-link command timed out")
         return False
     except FileNotFoundError:
@@ -192,42 +138,26 @@ async def verify_with_pw_link(expected_connections):
         return False
 
 
-@pytest.mark.asyncio
-async def test_create_pedalboard_check_jack_connections():
+async def test_create_pedalboard_check_jack_connections(session_service, reset_session):
     """
     Alternative test using JACK commands if available
     """
-    os.environ["SESSION_MANAGER_AUTO_CREATE_DEFAULT"] = "0"
-
-    service = SessionManagerService()
-    await service.startup()
-    await asyncio.sleep(1.0)
+    # Create pedalboard
+    result = await session_service.session_manager.create_pedalboard("JACK Test Pedalboard")
+    assert result.get("pedalboard_id") is not None
 
+    # Try to get JACK port information first
     try:
-        # Create pedalboard
-        result = await service.session_manager.create_pedalboard("JACK Test Pedalboard")
-        assert result.get("pedalboard_id") is not None
-
-        # Try to get JACK port information first
-        try:
-            jack_result = subprocess.run(
-                ["jack_lsp", "-c"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if jack_result.returncode == 0:
-                print("JACK ports and connections:")
-                print(jack_result.stdout)
-            else:
-                print("JACK not available or no connections")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("jack_lsp command not available")
-
-        # Test basic session manager functionality
-        status = service.session_manager.get_status()
-        print(f"Session status: {status}")
-        assert status["current_pedalboard"] == "JACK Test Pedalboard"
-
-    finally:
-        await service.shutdown()
\ No newline at end of file
+        returncode, output, _ = await run_command("jack_lsp", "-c")
+        if returncode == 0:
+            print("JACK ports and connections:")
+            print(output)
+        else:
+            print("JACK not available or no connections")
+    except (asyncio.TimeoutError, FileNotFoundError):
+        print("jack_lsp command not available")
+
+    # Test basic session manager functionality
+    status = session_service.session_manager.get_status()
+    print(f"Session status: {status}")
+    assert status["current_pedalboard"] == "JACK Test Pedalboard"
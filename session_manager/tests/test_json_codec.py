@@ -0,0 +1,35 @@
+"""Tests for the JSON codec shared by the ZeroMQ clients."""
+import json
+from types import MappingProxyType
+
+import pytest
+
+from ..infrastructure import json_codec
+
+
+def test_json_encoder_stringifies_non_str_keys():
+    """Test the stdlib fallback encodes non-str keys like json.dumps."""
+    encoded = json_codec._json_dumps({1: "a", "b": [1.5, None]})
+
+    assert json.loads(encoded) == {"1": "a", "b": [1.5, None]}
+
+
+def test_orjson_encoder_matches_json_fallback():
+    """Test orjson produces the same message as the fallback for non-str keys."""
+    pytest.importorskip("orjson")
+    message = {1: "a", "b": [1.5, None], "c": {2: True}}
+
+    encoded = json_codec._orjson_dumps(message)
+
+    assert json.loads(encoded) == json.loads(json_codec._json_dumps(message))
+
+
+def test_encoders_write_read_only_views_as_objects():
+    """Test snapshot parameter views encode like the dicts they wrap."""
+    message = {"plugin_states": {"fx_1": MappingProxyType({"drive": 0.5})}}
+    encoders = [json_codec._json_dumps]
+    if json_codec.orjson is not None:
+        encoders.append(json_codec._orjson_dumps)
+
+    for dumps in encoders:
+        assert json.loads(dumps(message)) == {"plugin_states": {"fx_1": {"drive": 0.5}}}
@@ -0,0 +1,32 @@
+"""Tests for the SessionManagerService lifecycle."""
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+
+from .. import main
+from ..main import SessionManagerService
+
+
+async def test_startup_raises_when_zmq_service_fails(monkeypatch):
+    """Test startup stops instead of running without its ZeroMQ sockets."""
+    monkeypatch.setattr(main.ZMQService, "start", AsyncMock(return_value=False))
+    service = SessionManagerService()
+
+    with pytest.raises(RuntimeError, match="ZeroMQ service failed to start"):
+        await service.startup()
+
+    assert service.running is False
+    assert service.zmq_service is None
+
+
+def test_invalid_log_level_falls_back_to_info(monkeypatch, caplog):
+    """Test a bad LOG_LEVEL warns and uses INFO instead of raising."""
+    monkeypatch.setenv("LOG_LEVEL", "loud")
+    basic_config = []
+    monkeypatch.setattr(main.logging, "basicConfig", lambda **kwargs: basic_config.append(kwargs))
+
+    main._configure_logging()
+
+    assert basic_config == [{"level": logging.INFO}]
+    assert "Unknown LOG_LEVEL 'LOUD'" in caplog.text
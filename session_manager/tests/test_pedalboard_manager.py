@@ -0,0 +1,208 @@
+"""Tests for PedalboardManager."""
+import pytest
+
+from ..managers.pedalboard_manager import PedalboardManager
+
+GX_DISTORTION = "http://guitarix.sourceforge.net/plugins/gx_distortion"
+GX_REVERB = "http://guitarix.sourceforge.net/plugins/gx_reverb"
+
+
+@pytest.fixture
+def pedalboard_manager(plugin_manager, mock_bridge_client):
+    """Create PedalboardManager instance for testing."""
+    return PedalboardManager(plugin_manager, mock_bridge_client)
+
+
+@pytest.fixture
+def saved_pedalboard():
+    """Saved pedalboard data with two chained plugins."""
+    return {
+        "id": "pb1",
+        "name": "Saved PB",
+        "plugins": [
+            {"uri": GX_DISTORTION, "instance_id": "old_1"},
+            {"uri": GX_REVERB, "instance_id": "old_2"},
+        ],
+        "connections": [
+            {"source_plugin": "old_1", "source_port": "out", "target_plugin": "old_2", "target_port": "in"},
+        ],
+        "system_inputs": ["system:capture_1", "system:capture_2"],
+        "system_outputs": ["system:playback_1", "system:playback_2"],
+    }
+
+
+async def test_load_pedalboard_keeps_plugin_order(pedalboard_manager, saved_pedalboard):
+    """Test plugins load in saved order and connections are remapped."""
+    result = await pedalboard_manager.load_pedalboard(saved_pedalboard)
+
+    assert result["status"] == "ok"
+    assert result["plugins_loaded"] == 2
+    plugins = pedalboard_manager.current_pedalboard.plugins
+    assert [p["uri"] for p in plugins] == [GX_DISTORTION, GX_REVERB]
+
+    new_ids = [p["instance_id"] for p in plugins]
+    assert "old_1" not in new_ids
+    connection = pedalboard_manager.current_pedalboard.connections[0]
+    assert (connection.source_plugin, connection.target_plugin) == tuple(new_ids)
+
+
+async def test_load_pedalboard_skips_failed_plugin(pedalboard_manager, saved_pedalboard):
+    """Test a plugin that fails to load is skipped without aborting the load."""
+    saved_pedalboard["plugins"].insert(1, {"uri": "http://nonexistent.plugin", "instance_id": "old_x"})
+
+    result = await pedalboard_manager.load_pedalboard(saved_pedalboard)
+
+    assert result["plugins_loaded"] == 2
+    assert [p["uri"] for p in pedalboard_manager.current_pedalboard.plugins] == [GX_DISTORTION, GX_REVERB]
+
+
+async def test_load_pedalboard_drops_failed_connections(pedalboard_manager, saved_pedalboard, mock_bridge_client):
+    """Test connections rejected by the bridge are not kept."""
+    default_call = mock_bridge_client.call.side_effect
+
+    def failing_connect(service, method, **kwargs):
+        if method == "create_connection":
+            return {"success": False, "error": "port not found"}
+        return default_call(service, method, **kwargs)
+
+    mock_bridge_client.call.side_effect = failing_connect
+
+    result = await pedalboard_manager.load_pedalboard(saved_pedalboard)
+
+    assert result["connections_created"] == 0
+    assert len(pedalboard_manager.connections) == 0
+
+
+async def test_load_pedalboard_wires_system_io(pedalboard_manager, saved_pedalboard):
+    """Test system inputs feed the first plugin and the last plugin feeds the outputs."""
+    result = await pedalboard_manager.load_pedalboard(saved_pedalboard)
+
+    first_id, last_id = [p["instance_id"] for p in pedalboard_manager.current_pedalboard.plugins]
+    assert result["system_io"]["created_connections"] == [
+        f"system:capture_1 -> {first_id}:in_1",
+        f"system:capture_2 -> {first_id}:in_2",
+        f"{last_id}:out_1 -> system:playback_1",
+        f"{last_id}:out_2 -> system:playback_2",
+    ]
+    assert result["system_io"]["failed_connections"] == []
+
+
+async def test_apply_snapshot_counts_applied_parameters(pedalboard_manager, saved_pedalboard):
+    """Test snapshot parameters are applied and invalid ones are skipped."""
+    await pedalboard_manager.load_pedalboard(saved_pedalboard)
+    instance_id = pedalboard_manager.current_pedalboard.plugins[0]["instance_id"]
+
+    snapshot = {
+        "id": "snap1",
+        "plugin_states": {
+            instance_id: {"drive": 0.9, "unknown": 1.0},
+            "not_loaded": {"drive": 0.1},
+        },
+    }
+    result = await pedalboard_manager.apply_snapshot(snapshot)
+
+    assert result["parameters_applied"] == 1
+    assert pedalboard_manager.plugin_manager.instances[instance_id].parameters["drive"] == 0.9
+
+
+async def test_serialized_pedalboard_reused_until_modified(pedalboard_manager, storage_dir):
+    """Test the serialized view is cached and refreshed after a save."""
+    await pedalboard_manager.create_pedalboard("Cached")
+
+    first = await pedalboard_manager.get_current_pedalboard(persist=False)
+    second = await pedalboard_manager.get_current_pedalboard(persist=False)
+    assert first["pedalboard"] == second["pedalboard"]
+    assert first["pedalboard"]["plugins"] is second["pedalboard"]["plugins"]
+
+    saved = await pedalboard_manager.save_pedalboard()
+    assert saved["pedalboard"] is not first["pedalboard"]
+    assert saved["pedalboard"]["modified_at"] == pedalboard_manager.current_pedalboard.modified_at.isoformat()
+    assert "saved_at" not in saved["pedalboard"]["metadata"]
+
+
+async def test_serialized_pedalboard_mutation_does_not_leak(pedalboard_manager):
+    """Test a caller changing a returned result does not alter the next one."""
+    await pedalboard_manager.create_pedalboard("Cached")
+
+    first = await pedalboard_manager.get_current_pedalboard(persist=False)
+    first["pedalboard"]["name"] = "Changed"
+    first["pedalboard"]["extra"] = True
+
+    second = await pedalboard_manager.get_current_pedalboard(persist=False)
+    assert second["pedalboard"]["name"] == "Cached"
+    assert "extra" not in second["pedalboard"]
+
+
+def test_validate_system_io_reports_missing_and_extra(pedalboard_manager):
+    """Test missing saved ports trigger replacement and keep port order."""
+    result = pedalboard_manager._validate_system_io(
+        ["system:capture_2", "system:capture_9"],
+        ["system:playback_1"],
+        ["system:capture_1", "system:capture_2", "system:capture_3"],
+        ["system:playback_1", "system:playback_2"],
+    )
+
+    assert result["missing_inputs"] == ["system:capture_9"]
+    assert result["missing_outputs"] == []
+    assert result["extra_inputs"] == ["system:capture_1", "system:capture_3"]
+    assert result["extra_outputs"] == ["system:playback_2"]
+    assert result["strategy"] == "replaced_missing_with_current"
+    assert result["changed"] is True
+
+
+async def test_events_published_in_background(plugin_manager, mock_bridge_client, mock_servicebus):
+    """Test events are emitted without blocking and flushed by close()."""
+    manager = PedalboardManager(plugin_manager, mock_bridge_client, mock_servicebus)
+
+    await manager.create_pedalboard("Events")
+    await manager.close()
+
+    mock_servicebus.publish_event.assert_called_once()
+    assert mock_servicebus.publish_event.call_args.args[0] == "pedalboard_created"
+    assert not manager._pending
+
+
+async def test_snapshot_parameters_are_copy_on_write(pedalboard_manager, saved_pedalboard, mock_bridge_client):
+    """Test snapshots keep their values after later parameter changes."""
+    await pedalboard_manager.load_pedalboard(saved_pedalboard)
+    plugin_manager = pedalboard_manager.plugin_manager
+    instance_id = pedalboard_manager.current_pedalboard.plugins[0]["instance_id"]
+    await plugin_manager.set_parameter(instance_id, "drive", 0.2)
+
+    snapshot = (await pedalboard_manager.create_snapshot("before"))["snapshot"]
+    mock_bridge_client.call.reset_mock()
+    unchanged = await pedalboard_manager.apply_snapshot(snapshot)
+    # Still counted as applied, but no RPC is needed to re-apply it
+    assert unchanged["parameters_applied"] == 1
+    assert mock_bridge_client.call.call_count == 0
+
+    await plugin_manager.set_parameter(instance_id, "drive", 0.7)
+    assert snapshot["plugin_states"][instance_id] == {"drive": 0.2}
+
+    restored = await pedalboard_manager.apply_snapshot(snapshot)
+    assert restored["parameters_applied"] == 1
+    assert plugin_manager.instances[instance_id].parameters["drive"] == 0.2
+
+
+async def test_snapshot_parameters_are_read_only(pedalboard_manager, saved_pedalboard):
+    """Test a snapshot's parameter views cannot be written in place."""
+    await pedalboard_manager.load_pedalboard(saved_pedalboard)
+    instance_id = pedalboard_manager.current_pedalboard.plugins[0]["instance_id"]
+
+    snapshot = (await pedalboard_manager.create_snapshot("frozen"))["snapshot"]
+
+    with pytest.raises(TypeError):
+        snapshot["plugin_states"][instance_id]["drive"] = 0.9
+
+
+def test_validate_system_io_identical_ports_kept(pedalboard_manager):
+    """Test identical saved and current ports are kept unchanged."""
+    inputs = ["system:capture_1", "system:capture_2"]
+    outputs = ["system:playback_1", "system:playback_2"]
+
+    result = pedalboard_manager._validate_system_io(inputs, outputs, list(inputs), list(outputs))
+
+    assert result["strategy"] == "kept_saved"
+    assert result["changed"] is False
+    assert result["resolved_inputs"] == inputs
+    assert result["missing_inputs"] == result["extra_outputs"] == []
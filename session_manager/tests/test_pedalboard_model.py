@@ -0,0 +1,43 @@
+"""Tests for the Pedalboard model helpers."""
+from datetime import datetime
+
+from ..models.pedalboard import Pedalboard
+
+
+def _make_pedalboard(**kwargs):
+    now = datetime(2024, 1, 1)
+    defaults = dict(
+        id="pb1",
+        name="Test",
+        description="",
+        plugins=[],
+        connections=[],
+        created_at=now,
+        modified_at=now,
+        metadata={},
+    )
+    defaults.update(kwargs)
+    return Pedalboard(**defaults)
+
+
+def test_set_system_inputs_unchanged_keeps_modified_at():
+    """Setting identical system inputs must not bump modified_at."""
+    pb = _make_pedalboard(system_inputs=["system:capture_1"])
+    before = pb.modified_at
+
+    pb.set_system_inputs(["system:capture_1"])
+
+    assert pb.modified_at == before
+
+
+def test_set_system_outputs_changed_updates_value():
+    """Changing system outputs stores a copy and bumps modified_at."""
+    pb = _make_pedalboard(system_outputs=["system:playback_1"])
+    before = pb.modified_at
+    outputs = ["system:playback_1", "system:playback_2"]
+
+    pb.set_system_outputs(outputs)
+
+    assert pb.system_outputs == outputs
+    assert pb.system_outputs is not outputs
+    assert pb.modified_at > before
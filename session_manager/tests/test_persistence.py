@@ -1,18 +1,14 @@
-import pytest
+import os
+import shutil
 
 from ..managers.plugin_manager import PluginManager
 from ..managers.session_manager import SessionManager
 
 
-@pytest.mark.asyncio
-async def test_pedalboard_save_load_delete(tmp_path, monkeypatch, mock_bridge_client):
-    # Use a dedicated data dir for the test
-    data_dir = tmp_path / "sm_data"
-    monkeypatch.setenv("SESSION_MANAGER_DATA_DIR", str(data_dir))
-
+async def test_pedalboard_save_load_delete(storage_dir, mock_bridge_client):
     # Setup plugin manager with mock bridge
     pm = PluginManager(mock_bridge_client, None)
-    await pm.initialize()
+    await pm.initialize(skip_scan=True)
 
     sm = SessionManager(pm, mock_bridge_client, None)
 
@@ -41,12 +37,9 @@ async def test_pedalboard_save_load_delete(tmp_path, monkeypatch, mock_bridge_cl
     assert storage.load_pedalboard(saved_id) is None
 
 
-@pytest.mark.asyncio
-async def test_export_import_pedalboard(tmp_path, monkeypatch, mock_bridge_client):
-    monkeypatch.setenv("SESSION_MANAGER_DATA_DIR", str(tmp_path / "sm_data"))
-
+async def test_export_import_pedalboard(tmp_path, storage_dir, mock_bridge_client):
     pm = PluginManager(mock_bridge_client, None)
-    await pm.initialize()
+    await pm.initialize(skip_scan=True)
     sm = SessionManager(pm, mock_bridge_client, None)
 
     await sm.create_pedalboard("X", "y")
@@ -58,11 +51,22 @@ async def test_export_import_pedalboard(tmp_path, monkeypatch, mock_bridge_clien
     # Export via storage
     from ..infrastructure import storage
 
-    ok = storage.export_pedalboard(pb_id, str(out_file))
+    ok = storage.export_pedalboard(pb_id, os.fspath(out_file))
     assert ok is True
 
     # Import back
-    res = storage.import_pedalboard(str(out_file))
+    res = storage.import_pedalboard(os.fspath(out_file))
     assert res is not None
     new_id, new_path = res
     assert storage.load_pedalboard(new_id) is not None
+
+
+def test_save_recreates_removed_data_dir(storage_dir):
+    from ..infrastructure import storage
+
+    storage.save_pedalboard({"name": "first"})
+    shutil.rmtree(storage_dir)
+
+    pb_id, path = storage.save_pedalboard({"name": "second"})
+    assert os.path.exists(path)
+    assert storage.load_pedalboard(pb_id)["name"] == "second"
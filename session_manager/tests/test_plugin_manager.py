@@ -9,7 +9,6 @@ import pytest
 class TestPluginManager:
     """Test cases for PluginManager."""
 
-    @pytest.mark.asyncio
     async def test_get_available_plugins(self, plugin_manager):
         """Test getting available plugins."""
         plugins = await plugin_manager.get_available_plugins()
@@ -17,12 +16,10 @@ class TestPluginManager:
         # Should have at least the mock plugin
         assert len(plugins) > 0
 
-    @pytest.mark.asyncio
-    async def test_load_plugin_success(self, plugin_manager):
+    async def test_load_plugin_success(self, plugin_manager, sample_plugin_uri):
         """Test successful plugin loading."""
         # Use the mock plugin URI from available plugins
-        plugins = await plugin_manager.get_available_plugins()
-        test_uri = list(plugins.keys())[0]
+        test_uri = sample_plugin_uri
 
         # Mock bridge operations - already configured in conftest.py
         # The mock_bridge_client.call returns {"success": True} by default
@@ -35,49 +32,46 @@ class TestPluginManager:
         instance_id = result["instance_id"]
         assert instance_id in plugin_manager.instances
 
-    @pytest.mark.asyncio
+    async def test_load_plugin_copies_initial_parameters(self, plugin_manager, sample_plugin_uri):
+        """Test the caller's parameters dict is not stored by reference."""
+        parameters = {"drive": 0.3}
+
+        result = await plugin_manager.load_plugin(sample_plugin_uri, 100, 200, parameters=parameters)
+        parameters["drive"] = 0.9
+
+        instance = plugin_manager.instances[result["instance_id"]]
+        assert instance.parameters == {"drive": 0.3}
+
+    async def test_load_plugins_keeps_spec_order(self, plugin_manager, sample_plugin_uri):
+        """Test concurrent loads register distinct instances in spec order."""
+        results = await plugin_manager.load_plugins(
+            [(sample_plugin_uri, 100, 200), (sample_plugin_uri, 300, 400)]
+        )
+
+        assert [r["plugin"]["x"] for r in results] == [100, 300]
+        assert len({r["instance_id"] for r in results}) == 2
+        assert all(r["instance_id"] in plugin_manager.instances for r in results)
+
     async def test_load_plugin_not_found(self, plugin_manager):
         """Test loading non-existent plugin."""
         with pytest.raises(ValueError, match="Plugin not found"):
             await plugin_manager.load_plugin("http://nonexistent.plugin", 0, 0)
 
-    @pytest.mark.asyncio
-    async def test_unload_plugin_success(self, plugin_manager):
+    async def test_unload_plugin_success(self, plugin_manager, loaded_instance):
         """Test successful plugin unloading."""
-        # First load a plugin
-        plugins = await plugin_manager.get_available_plugins()
-        test_uri = list(plugins.keys())[0]
-
-        # Bridge operations are mocked in conftest.py
-
-        load_result = await plugin_manager.load_plugin(test_uri, 100, 200)
-        instance_id = load_result["instance_id"]
-
-        # Then unload it
-        result = await plugin_manager.unload_plugin(instance_id)
+        result = await plugin_manager.unload_plugin(loaded_instance)
 
         assert result["status"] == "ok"
-        assert instance_id not in plugin_manager.instances
+        assert loaded_instance not in plugin_manager.instances
 
-    @pytest.mark.asyncio
     async def test_unload_plugin_not_loaded(self, plugin_manager):
         """Test unloading plugin that isn't loaded."""
         with pytest.raises(ValueError, match="Plugin instance not found"):
             await plugin_manager.unload_plugin("nonexistent_id")
 
-    @pytest.mark.asyncio
-    async def test_set_parameter_success(self, plugin_manager):
+    async def test_set_parameter_success(self, plugin_manager, loaded_instance):
         """Test successful parameter setting."""
-        # Load plugin first
-        plugins = await plugin_manager.get_available_plugins()
-        test_uri = list(plugins.keys())[0]
-
-        # Bridge operations are mocked in conftest.py
-
-        load_result = await plugin_manager.load_plugin(test_uri, 100, 200)
-        instance_id = load_result["instance_id"]
-
-        result = await plugin_manager.set_parameter(instance_id, "drive", 0.8)
+        result = await plugin_manager.set_parameter(loaded_instance, "drive", 0.8)
 
         assert result["status"] == "ok"
         assert result["value"] == 0.8
@@ -85,83 +79,118 @@ class TestPluginManager:
         # Check if event was published
         plugin_manager.zmq_service.publish_event.assert_called()
 
-    @pytest.mark.asyncio
     async def test_set_parameter_plugin_not_loaded(self, plugin_manager):
         """Test setting parameter on non-loaded plugin."""
         with pytest.raises(ValueError, match="Plugin instance not found"):
             await plugin_manager.set_parameter("nonexistent_id", "gain", 0.5)
 
-    @pytest.mark.asyncio
-    async def test_get_parameter_success(self, plugin_manager):
+    async def test_get_parameter_success(self, plugin_manager, loaded_instance):
         """Test successful parameter getting."""
-        # Load plugin first
-        plugins = await plugin_manager.get_available_plugins()
-        test_uri = list(plugins.keys())[0]
-
-        # Bridge operations are mocked in conftest.py
-
-        load_result = await plugin_manager.load_plugin(test_uri, 100, 200)
-        instance_id = load_result["instance_id"]
-
-        result = await plugin_manager.get_parameter(instance_id, "drive")
+        result = await plugin_manager.get_parameter(loaded_instance, "drive")
         assert "value" in result
         assert result["parameter"] == "drive"
 
-    @pytest.mark.asyncio
     async def test_get_parameter_plugin_not_loaded(self, plugin_manager):
         """Test getting parameter from non-loaded plugin."""
         with pytest.raises(ValueError, match="Plugin instance not found"):
             await plugin_manager.get_parameter("nonexistent_id", "drive")
 
-    @pytest.mark.asyncio
-    async def test_get_plugin_info(self, plugin_manager):
+    async def test_get_plugin_info(self, plugin_manager, sample_plugin_uri, loaded_instance):
         """Test getting plugin info."""
-        # Load plugin first
-        plugins = await plugin_manager.get_available_plugins()
-        test_uri = list(plugins.keys())[0]
-
-        # Bridge operations are mocked in conftest.py
-
-        load_result = await plugin_manager.load_plugin(test_uri, 100, 200)
-        instance_id = load_result["instance_id"]
-
-        result = await plugin_manager.get_plugin_info(instance_id)
+        result = await plugin_manager.get_plugin_info(loaded_instance)
         assert "plugin" in result
-        assert result["plugin"]["uri"] == test_uri
+        assert result["plugin"]["uri"] == sample_plugin_uri
 
-    @pytest.mark.asyncio
-    async def test_list_instances(self, plugin_manager):
+    async def test_list_instances(self, plugin_manager, loaded_instances):
         """Test listing plugin instances."""
-        # Load multiple plugins
-        plugins = await plugin_manager.get_available_plugins()
-        test_uri = list(plugins.keys())[0]
-
-        # Bridge operations are mocked in conftest.py
-
-        load_result1 = await plugin_manager.load_plugin(test_uri, 100, 200)
-        load_result2 = await plugin_manager.load_plugin(test_uri, 300, 400)
-
         result = await plugin_manager.list_instances()
 
         assert "instances" in result
-        assert len(result["instances"]) == 2
+        assert len(result["instances"]) == len(loaded_instances)
 
-        instance_ids = [load_result1["instance_id"], load_result2["instance_id"]]
-        for instance_id in instance_ids:
+        for instance_id in loaded_instances:
             assert instance_id in result["instances"]
 
-    @pytest.mark.asyncio
-    async def test_clear_all_plugins(self, plugin_manager):
+    async def test_clear_all_plugins(self, plugin_manager, loaded_instances):
         """Test clearing all plugins."""
-        # Load multiple plugins
-        plugins = await plugin_manager.get_available_plugins()
-        test_uri = list(plugins.keys())[0]
+        await plugin_manager.clear_all()
 
-        # Bridge operations are mocked in conftest.py
+        assert len(plugin_manager.instances) == 0
 
-        await plugin_manager.load_plugin(test_uri, 100, 200)
-        await plugin_manager.load_plugin(test_uri, 300, 400)
+    async def test_clear_all_uses_single_bridge_call(self, plugin_manager, sample_plugin_uri, mock_bridge_client):
+        """Test clearing plugins issues one bulk bridge command."""
+        test_uri = sample_plugin_uri
+
+        await plugin_manager.load_plugins([(test_uri, 100, 200), (test_uri, 300, 400)])
+        mock_bridge_client.call.reset_mock()
 
         await plugin_manager.clear_all()
 
+        methods = [call.args[1] for call in mock_bridge_client.call.call_args_list]
+        assert methods == ["clear_all"]
         assert len(plugin_manager.instances) == 0
+
+    async def test_clear_all_publishes_unloads_as_one_batch(self, plugin_manager, loaded_instances, mock_servicebus):
+        """Test a bulk clear reports every unloaded instance in a single batch."""
+        await plugin_manager.clear_all()
+
+        mock_servicebus.publish_batch.assert_awaited_once()
+        events = mock_servicebus.publish_batch.await_args.args[0]
+        assert [name for name, _ in events] == ["plugin_unloaded"] * len(loaded_instances)
+        assert sorted(data["instance_id"] for _, data in events) == sorted(loaded_instances)
+
+    async def test_clear_all_falls_back_to_concurrent_unloads(self, plugin_manager, loaded_instances, mock_bridge_client):
+        """Test a failed bulk clear unloads every instance individually."""
+        default = mock_bridge_client.call.side_effect
+
+        def fail_clear_all(service, method, **kwargs):
+            if method == "clear_all":
+                return {"success": False, "error": "unsupported"}
+            return default(service, method, **kwargs)
+
+        mock_bridge_client.call.side_effect = fail_clear_all
+        mock_bridge_client.call.reset_mock()
+
+        await plugin_manager.clear_all()
+
+        unloaded = {
+            call.kwargs["instance_id"]
+            for call in mock_bridge_client.call.call_args_list
+            if call.args[1] == "unload_plugin"
+        }
+        assert unloaded == set(loaded_instances)
+        assert len(plugin_manager.instances) == 0
+
+    async def test_unload_plugin_bridge_error_keeps_instance(self, plugin_manager, loaded_instance, mock_bridge_client):
+        """Test the instance stays registered when the bridge call raises."""
+        default = mock_bridge_client.call.side_effect
+        mock_bridge_client.call.side_effect = RuntimeError("bridge down")
+
+        with pytest.raises(RuntimeError, match="bridge down"):
+            await plugin_manager.unload_plugin(loaded_instance)
+        mock_bridge_client.call.side_effect = default
+
+        assert loaded_instance in plugin_manager.instances
+
+    async def test_instance_to_dict_matches_asdict(self, plugin_manager, sample_plugin_uri):
+        """Test the shallow to_dict view matches dataclasses.asdict."""
+        from dataclasses import asdict
+
+        test_uri = sample_plugin_uri
+        load_result = await plugin_manager.load_plugin(test_uri, 100, 200, parameters={"drive": 0.2})
+        instance = plugin_manager.instances[load_result["instance_id"]]
+
+        data = instance.to_dict()
+
+        assert data == asdict(instance)
+        assert data["parameters"] is not instance.parameters
+
+    async def test_initialize_skip_scan(self, mock_bridge_client, mock_servicebus):
+        """Test skip_scan initializes without querying the bridge."""
+        from ..managers.plugin_manager import PluginManager
+
+        manager = PluginManager(mock_bridge_client, mock_servicebus)
+        await manager.initialize(skip_scan=True)
+
+        mock_bridge_client.call.assert_not_called()
+        assert manager.available_plugins == {}
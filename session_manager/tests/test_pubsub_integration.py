@@ -2,10 +2,12 @@ import asyncio
 import uuid
 
 import pytest
-from servicebus import Service
+
+from .helpers import wait_subscribed
+
+Service = pytest.importorskip("servicebus").Service
 
 
-@pytest.mark.asyncio
 async def test_pubsub_event_delivery():
     # Create unique service names to avoid accidental port collisions
     pub_name = f"pub_{uuid.uuid4().hex[:8]}"
@@ -17,9 +19,6 @@ async def test_pubsub_event_delivery():
     await subscriber.start()
     await publisher.start()
 
-    # Wait briefly to ensure sockets have bound and connected
-    await asyncio.sleep(0.15)
-
     got = asyncio.Event()
     result = {}
 
@@ -33,8 +32,8 @@ async def test_pubsub_event_delivery():
     # Register event handler on subscriber
     subscriber.register_event_handler("test.event", handler)
 
-    # Give subscription a moment to be applied
-    await asyncio.sleep(0.05)
+    # Wait until the subscription is live (probe events round-trip)
+    await wait_subscribed(lambda t: publisher.publish_event(t, {}), subscriber)
 
     # Publish an event from publisher
     await publisher.publish_event("test.event", {"hello": "world"})
@@ -41,7 +41,6 @@ def session_control_service(mock_bridge_client, mock_plugin_manager, mock_connec
     return SessionControlService(mock_bridge_client, mock_plugin_manager, mock_connection_service, mock_service_bus)
 
 
-@pytest.mark.asyncio
 async def test_reset_session_success(session_control_service, mock_bridge_client, mock_plugin_manager, mock_connection_service, mock_service_bus):
     """Test successful session reset."""
     # Setup
@@ -60,7 +59,6 @@ async def test_reset_session_success(session_control_service, mock_bridge_client
     mock_service_bus.publish_event.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_reset_session_failure(session_control_service, mock_bridge_client, mock_plugin_manager, mock_connection_service):
     """Test session reset failure."""
     # Setup
@@ -74,7 +72,6 @@ async def test_reset_session_failure(session_control_service, mock_bridge_client
     assert "Failed to reset mod-host state" in result["message"]
 
 
-@pytest.mark.asyncio
 async def test_mute_session_success(session_control_service, mock_bridge_client, mock_service_bus):
     """Test successful session mute."""
     # Setup
@@ -91,7 +88,6 @@ async def test_mute_session_success(session_control_service, mock_bridge_client,
     mock_service_bus.publish_event.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_unmute_session_success(session_control_service, mock_bridge_client, mock_service_bus):
     """Test successful session unmute."""
     # Setup
@@ -108,7 +104,6 @@ async def test_unmute_session_success(session_control_service, mock_bridge_clien
     mock_service_bus.publish_event.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_session_state(session_control_service, mock_bridge_client, mock_plugin_manager, mock_connection_service):
     """Test getting session state."""
     # Setup
@@ -127,7 +122,6 @@ async def test_get_session_state(session_control_service, mock_bridge_client, mo
     assert result["system"] == {"success": True, "data": "system_data"}
 
 
-@pytest.mark.asyncio
 async def test_initialize_session_success(session_control_service, mock_bridge_client, mock_plugin_manager, mock_connection_service, mock_service_bus):
     """Test successful session initialization."""
     # Setup
@@ -146,7 +140,6 @@ async def test_initialize_session_success(session_control_service, mock_bridge_c
     mock_service_bus.publish_event.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_initialize_session_failure(session_control_service, mock_bridge_client, mock_plugin_manager, mock_connection_service):
     """Test session initialization failure."""
     # Setup
@@ -0,0 +1,44 @@
+"""
+Tests for SessionManager coordination.
+"""
+
+
+class TestSessionManagerStatus:
+    """Test cases for SessionManager.get_status caching."""
+
+    async def test_get_status_cached_until_mutation(self, session_manager):
+        """Status is reused between polls and rebuilt after a mutation."""
+        status = session_manager.get_status()
+        assert status["current_pedalboard"] is None
+        assert session_manager.get_status() == status
+
+        await session_manager.create_pedalboard("Status PB")
+
+        status = session_manager.get_status()
+        assert status["current_pedalboard"] == "Status PB"
+        assert status["loaded_plugins"] == 0
+
+    async def test_get_status_tracks_plugin_changes(self, session_manager, plugin_manager):
+        """Loading a plugin through the plugin manager invalidates the cache."""
+        assert session_manager.get_status()["loaded_plugins"] == 0
+
+        plugins = await plugin_manager.get_available_plugins()
+        await plugin_manager.load_plugin(next(iter(plugins)))
+
+        assert session_manager.get_status()["loaded_plugins"] == 1
+
+
+class TestSessionManagerConnections:
+    """Test cases for connection state shared between services."""
+
+    async def test_connection_after_load_tracked_once(self, session_manager, plugin_manager):
+        """Connections created after a load are stored once per service."""
+        uri = next(iter(await plugin_manager.get_available_plugins()))
+        await session_manager.load_pedalboard({"name": "Loaded", "plugins": [{"uri": uri}, {"uri": uri}]})
+        source, target = [p["instance_id"] for p in session_manager.pedalboard_service.current_pedalboard.plugins]
+
+        await session_manager.create_connection(source, "out", target, "in")
+
+        assert len(session_manager.connection_service.connections) == 1
+        assert len(session_manager.pedalboard_service.connections) == 1
+        assert session_manager.get_status()["active_connections"] == 1
@@ -0,0 +1,57 @@
+"""Tests for ZMQHandlers registration and call serialization."""
+import asyncio
+import inspect
+from unittest.mock import Mock
+
+import pytest
+
+from ..handlers.zmq_handlers import ZMQHandlers
+
+
+@pytest.fixture
+def registered(mock_bridge_client, plugin_manager, session_manager):
+    """RPC handlers as registered with the ZeroMQ service, keyed by method name."""
+    handlers = {}
+    zmq_service = Mock()
+    zmq_service.register_handler.side_effect = handlers.__setitem__
+    ZMQHandlers(mock_bridge_client, plugin_manager, session_manager, zmq_service)
+    return handlers
+
+
+async def test_load_plugin_does_not_interleave_with_reset_session(
+    registered, plugin_manager, sample_plugin_uri, mock_bridge_client
+):
+    """Test a reset issued mid-load waits, so no stale instance survives it."""
+    default = mock_bridge_client.call.side_effect
+    in_bridge = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_load(service, method, **kwargs):
+        if method == "load_plugin":
+            in_bridge.set()
+            await release.wait()
+        return default(service, method, **kwargs)
+
+    mock_bridge_client.call.side_effect = slow_load
+
+    load = asyncio.create_task(registered["load_plugin"](uri=sample_plugin_uri))
+    await in_bridge.wait()
+    reset = asyncio.create_task(registered["reset_session"]())
+
+    # The reset must not run to completion while the load is still in flight
+    done, _ = await asyncio.wait({reset}, timeout=0.05)
+    assert not done
+
+    release.set()
+    load_result, reset_result = await asyncio.gather(load, reset)
+
+    assert load_result["success"] is True
+    assert reset_result["success"] is True
+    assert plugin_manager.instances == {}
+
+
+async def test_only_state_changing_handlers_are_serialized(registered):
+    """Test handlers marked concurrent=True are registered unwrapped."""
+    assert inspect.ismethod(registered["list_instances"])
+    assert not inspect.ismethod(registered["load_plugin"])
+    assert registered["load_plugin"].__name__ == "handle_load_plugin"
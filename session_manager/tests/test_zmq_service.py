@@ -0,0 +1,124 @@
+"""Tests for the direct ZMQService RPC client."""
+import asyncio
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from ..services.zmq_service import ZMQService
+
+
+@pytest_asyncio.fixture
+async def services():
+    """A server exposing an echo handler and a client service."""
+    server = ZMQService(f"server_{uuid.uuid4().hex[:8]}")
+    client = ZMQService(f"client_{uuid.uuid4().hex[:8]}")
+    server.register_handler("echo", lambda **params: params)
+    await server.start()
+    await client.start()
+    yield server, client
+    await client.stop()
+    await server.stop()
+
+
+async def test_concurrent_calls_share_req_socket(services):
+    """Test concurrent calls to one service are serialized on its REQ socket."""
+    server, client = services
+
+    results = await asyncio.gather(
+        *(client.call(server.service_name, "echo", timeout=2.0, n=i) for i in range(5))
+    )
+
+    assert results == [{"n": i} for i in range(5)]
+    assert list(client.req_sockets) == [server.service_name]
+
+
+async def test_timed_out_req_socket_is_dropped(services):
+    """Test a REQ socket left mid-request is discarded instead of reused."""
+    _, client = services
+
+    with pytest.raises(asyncio.TimeoutError):
+        await client.call("nobody_listening", "echo", timeout=0.05)
+
+    assert "nobody_listening" not in client.req_sockets
+
+
+async def test_server_handles_calls_concurrently(services):
+    """Test slow calls from different clients overlap on the ROUTER socket."""
+    server, client = services
+    other = ZMQService(f"client_{uuid.uuid4().hex[:8]}")
+    await other.start()
+
+    in_flight = 0
+    peak = 0
+    both_in = asyncio.Event()
+
+    async def slow(**params):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        if in_flight == 2:
+            both_in.set()
+        try:
+            # With serial handling the second call never arrives while we wait
+            await asyncio.wait_for(both_in.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            in_flight -= 1
+        return params
+
+    server.register_handler("slow", slow)
+    try:
+        results = await asyncio.gather(
+            client.call(server.service_name, "slow", timeout=2.0, who="client"),
+            other.call(server.service_name, "slow", timeout=2.0, who="other"),
+        )
+    finally:
+        await other.stop()
+
+    assert results == [{"who": "client"}, {"who": "other"}]
+    assert peak == 2
+
+
+async def test_unknown_method_returns_error(services):
+    """Test unknown methods are reported back as a remote error."""
+    server, client = services
+
+    with pytest.raises(RuntimeError, match="Method 'missing' not found"):
+        await client.call(server.service_name, "missing", timeout=2.0)
+
+
+async def test_publish_batch_delivers_every_event(services):
+    """Test a subscriber receives each frame of a batch, in order."""
+    server, client = services
+
+    # PUB drops messages until the subscription has propagated
+    async def probe():
+        while True:
+            await server.publish_event("__ready__", {})
+            if await client.sub_socket.poll(10):
+                await client.sub_socket.recv_multipart()
+                return
+
+    await asyncio.wait_for(probe(), timeout=2.0)
+
+    sent = await server.publish_batch([("plugin_unloaded", {"n": i}) for i in range(3)])
+
+    received = []
+    while len(received) < 3:
+        topic, payload = await asyncio.wait_for(client.sub_socket.recv_multipart(), timeout=2.0)
+        if topic != b"__ready__":
+            received.append(json.loads(payload)["data"])
+    assert sent == [True, True, True]
+    assert received == [{"n": i} for i in range(3)]
+
+
+async def test_publish_batch_reports_each_failure(services):
+    """Test events that cannot be encoded are flagged without dropping the rest."""
+    server, _ = services
+
+    sent = await server.publish_batch([("ok", {}), ("bad", {"value": object()}), ("ok", {})])
+
+    assert sent == [True, False, True]
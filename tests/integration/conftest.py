@@ -1,10 +1,8 @@
+import hashlib
 import os
 import shutil
 import subprocess
-import uuid
 import pytest
-import time
-import re
 
 from . import docker_helpers
 
@@ -13,6 +11,56 @@ def _docker_available() -> bool:
     return shutil.which("docker") is not None
 
 
+# Build-context paths the audio-engine Dockerfile copies into the image
+BUILD_INPUTS = (
+    "docker/audio-engine",
+    "audio-engine/mod-host",
+    "audio-engine/modhost-bridge",
+    "audio-engine/utils",
+    "scripts/start-service.sh",
+)
+INPUTS_LABEL = "marlise.test.inputs"
+
+
+def _build_inputs_hash(repo_root: str, stage: str):
+    """Hash the image's build inputs from git, including uncommitted edits.
+
+    Tracked files are covered by the index and the diff against HEAD;
+    untracked files by their names and their content hashes.
+    Returns None when git cannot describe the tree, so the caller rebuilds.
+    """
+
+    def git(*args, stdin=None):
+        proc = subprocess.run(
+            ["git", *args], cwd=repo_root, input=stdin, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        return proc.stdout if proc.returncode == 0 else None
+
+    h = hashlib.sha256(stage.encode())
+    outputs = [
+        git("ls-files", "-s", "--", *BUILD_INPUTS),
+        git("diff", "HEAD", "--", *BUILD_INPUTS),
+    ]
+    untracked = git("ls-files", "-o", "--exclude-standard", "--", *BUILD_INPUTS)
+    outputs.append(untracked)
+    if untracked:
+        outputs.append(git("hash-object", "--stdin-paths", stdin=untracked))
+    for out in outputs:
+        if out is None:
+            return None
+        h.update(out)
+    return h.hexdigest()
+
+
+def _image_inputs_label(tag: str):
+    proc = subprocess.run(
+        ["docker", "image", "inspect", "-f", f'{{{{ index .Config.Labels "{INPUTS_LABEL}" }}}}', tag],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    return proc.stdout.decode().strip() if proc.returncode == 0 else None
+
+
 @pytest.fixture(scope="session")
 def modhost_image_tag():
     """Build the Docker image for the chosen stage and yield (tag, stage).
@@ -34,43 +82,52 @@ def modhost_image_tag():
     tag = os.environ.get("MODHOST_TEST_TAG", "marlise-audio:local")
 
     # Build the image (builder or runtime/final). Use the same Dockerfile as README.
-    # Always build without cache in CI/test runs to ensure clean images.
-    no_cache = ["--no-cache"]
-    if stage == "builder":
-        build_cmd = [
-            "docker",
-            "build",
-            *no_cache,
-            "--target",
-            "builder",
-            "-f",
-            dockerfile,
-            "-t",
-            tag,
-            repo_root,
-        ]
+    # BuildKit with an inline layer cache lets later sessions reuse every
+    # unchanged layer of the previously built tag; MODHOST_TEST_NO_CACHE=1
+    # forces a clean build.
+    env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+    if os.environ.get("MODHOST_TEST_NO_CACHE") == "1":
+        cache_args = ["--no-cache"]
+    else:
+        cache_args = ["--cache-from", tag, "--build-arg", "BUILDKIT_INLINE_CACHE=1"]
+    target_args = ["--target", "builder"] if stage == "builder" else []
+    inputs_hash = _build_inputs_hash(repo_root, stage)
+    label_args = ["--label", f"{INPUTS_LABEL}={inputs_hash}"] if inputs_hash else []
+    build_cmd = [
+        "docker",
+        "build",
+        *cache_args,
+        *target_args,
+        *label_args,
+        "-f",
+        dockerfile,
+        "-t",
+        tag,
+        repo_root,
+    ]
+
+    # Skip the build entirely when the tag was built from identical inputs
+    if (
+        inputs_hash
+        and os.environ.get("MODHOST_TEST_NO_CACHE") != "1"
+        and _image_inputs_label(tag) == inputs_hash
+    ):
+        print(f"[modhost-test] reusing docker image {tag} (build inputs unchanged)")
     else:
-        build_cmd = [
-            "docker",
-            "build",
-            *no_cache,
-            "-f",
-            dockerfile,
-            "-t",
-            tag,
-            repo_root,
-        ]
-
-    print(f"[modhost-test] building docker image (stage={stage}) with tag: {tag}")
-    subprocess.check_call(build_cmd)
+        print(f"[modhost-test] building docker image (stage={stage}) with tag: {tag}")
+        subprocess.check_call(build_cmd, env=env)
 
     yield tag, stage
 
-    # Teardown: attempt to remove the temporary image
-    try:
-        subprocess.run(["docker", "rmi", "-f", tag], check=False)
-    except Exception:
-        pass
+    # Teardown: keep the image (and its layer cache) for the next session
+    # unless explicitly asked to remove it
+    if os.environ.get("MODHOST_TEST_CLEANUP_IMAGE") == "1":
+        try:
+            subprocess.run(["docker", "rmi", "-f", tag], check=False)
+        except Exception:
+            pass
+    else:
+        print(f"[modhost-test] keeping docker image {tag} for reuse (set MODHOST_TEST_CLEANUP_IMAGE=1 to remove it)")
 
 
 @pytest.fixture(scope="session")
@@ -1,6 +1,12 @@
+import json
+import os
+import re
+import selectors
 import subprocess
 import time
-import re
+
+# Lines mod-host prints once its command socket is accepting connections
+READY_PATTERN = re.compile(rb"mod-host ready!|PROTOCOL:")
 
 
 def start_runtime_container(tag: str):
@@ -22,17 +28,11 @@ def start_runtime_container(tag: str):
     host_port = None
     host_port_fb = None
     for _ in range(40):
-        proc_cmd = subprocess.run(["docker", "port", container_id, "5555"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        proc_fb = subprocess.run(["docker", "port", container_id, "5556"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if proc_cmd.returncode == 0 and proc_cmd.stdout.strip() and proc_fb.returncode == 0 and proc_fb.stdout.strip():
-            mapping = proc_cmd.stdout.decode().strip()
-            mapping_fb = proc_fb.stdout.decode().strip()
-            m = re.search(r":(\d+)$", mapping)
-            mfb = re.search(r":(\d+)$", mapping_fb)
-            if m and mfb:
-                host_port = int(m.group(1))
-                host_port_fb = int(mfb.group(1))
-                break
+        ports = _get_published_ports(container_id)
+        if 5555 in ports and 5556 in ports:
+            host_port = ports[5555]
+            host_port_fb = ports[5556]
+            break
         time.sleep(0.25)
 
     if host_port is None or host_port_fb is None:
@@ -41,21 +41,7 @@ def start_runtime_container(tag: str):
         raise RuntimeError(f"Failed to discover published ports for container {container_id}. Logs:\n{logs.stdout.decode(errors='ignore')}")
 
     # Wait for readiness
-    ready = False
-    deadline = time.time() + 20.0
-    while time.time() < deadline:
-        state = subprocess.run(["docker", "inspect", "-f", "{{.State.Running}}", container_id], stdout=subprocess.PIPE)
-        if state.returncode != 0 or state.stdout.decode().strip() != "true":
-            logs = subprocess.run(["docker", "logs", container_id], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            subprocess.run(["docker", "rm", "-f", container_id], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            raise RuntimeError(f"Container {container_id} exited prematurely. Logs:\n{logs.stdout.decode(errors='ignore')}")
-
-        logs = subprocess.run(["docker", "logs", container_id], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        out = logs.stdout.decode(errors="ignore")
-        if "mod-host ready!" in out or "PROTOCOL:" in out:
-            ready = True
-            break
-        time.sleep(0.25)
+    ready = _wait_for_ready_line(container_id, 20.0)
 
     if not ready:
         logs = subprocess.run(["docker", "logs", container_id], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
@@ -65,15 +51,76 @@ def start_runtime_container(tag: str):
     return container_id, host_port, host_port_fb
 
 
+def _get_published_ports(container_id: str) -> dict:
+    """Map container TCP ports to their published host ports in one docker call."""
+    proc = subprocess.run(
+        ["docker", "inspect", "-f", "{{json .NetworkSettings.Ports}}", container_id],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    if proc.returncode != 0:
+        return {}
+    ports = {}
+    for key, bindings in (json.loads(proc.stdout or b"null") or {}).items():
+        port, _, proto = key.partition("/")
+        if proto == "tcp" and bindings:
+            ports[int(port)] = int(bindings[0]["HostPort"])
+    return ports
+
+
+def _wait_for_ready_line(container_id: str, timeout: float) -> bool:
+    """Follow the container logs until mod-host reports readiness.
+
+    Streams `docker logs -f` and waits on its pipe with a selector, so the
+    ready line is seen as soon as it is written instead of on a polling
+    interval. The stream ends when the container exits, which raises instead
+    of waiting out the timeout.
+    """
+    proc = subprocess.Popen(["docker", "logs", "-f", container_id], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    lines = []
+    partial = b""
+    try:
+        with selectors.DefaultSelector() as sel:
+            sel.register(proc.stdout, selectors.EVENT_READ)
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                if not sel.select(remaining):
+                    break
+                chunk = os.read(proc.stdout.fileno(), 65536)
+                if not chunk:
+                    logs = b"".join(lines + [partial]).decode(errors="ignore")
+                    subprocess.run(["docker", "rm", "-f", container_id], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    raise RuntimeError(f"Container {container_id} exited prematurely. Logs:\n{logs}")
+                # Scan each complete line once instead of the whole log so far
+                *complete, partial = (partial + chunk).split(b"\n")
+                for line in complete:
+                    if READY_PATTERN.search(line):
+                        return True
+                lines.extend(line + b"\n" for line in complete)
+                # mod-host does not always end PROTOCOL lines with a newline
+                if READY_PATTERN.search(partial):
+                    return True
+        return False
+    finally:
+        proc.kill()
+        proc.wait()
+
+
 def stop_container(container_id: str):
     subprocess.run(["docker", "rm", "-f", container_id], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
-def run_container_with_modhost(tag: str, stage: str):
-    """Run the image once (ephemeral) to execute the installed mod-host binary
-    for a quick smoke check. Returns a subprocess.CompletedProcess like
-    subprocess.run(...).
+def run_container_with_modhost(tag: str, stage: str, container_id: str = None):
+    """Run the installed mod-host binary for a quick smoke check. Returns a
+    subprocess.CompletedProcess like subprocess.run(...).
+
+    With container_id, the binary is exec'd inside that already running
+    container instead of starting a new one.
     """
+    if container_id:
+        exec_cmd = ["docker", "exec", container_id, "/opt/marlise/bin/mod-host", "-V"]
+        return subprocess.run(exec_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=120)
+
     # Run the installed mod-host binary directly as the container entrypoint
     # This avoids running the image entrypoint (which manages jackd) and
     # keeps this check simple: just execute `/opt/marlise/bin/mod-host -V`.